@@ -0,0 +1,58 @@
+import json, os, sys, unittest
+
+# allow imports from the vdator directory
+VDATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "vdator")
+sys.path.append(VDATOR_DIR)
+
+from parsers import CodecsParser
+
+
+class TestCodecsParser(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(VDATOR_DIR, "data/codecs.json")) as f:
+            self.codecs_parser = CodecsParser(json.load(f))
+
+    def test_title_name_codec(self):
+        self.assertEqual(
+            self.codecs_parser.get_title_name_codec("DTS-HD.MA"),
+            ("DTS-HD Master Audio", ".dtsma"),
+        )
+        self.assertEqual(
+            self.codecs_parser.get_title_name_codec("AVC"),
+            ("MPEG-4 AVC Video", ".h264"),
+        )
+
+    def test_title_name_codec_without_extension(self):
+        # no eac3to codec for dolby digital plus
+        self.assertEqual(
+            self.codecs_parser.get_title_name_codec("DDP"),
+            ("Dolby Digital Plus Audio", ""),
+        )
+
+    def test_unknown_title_name(self):
+        self.assertEqual(self.codecs_parser.get_title_name_codec("MP3"), ("", ""))
+
+    def test_every_title_name(self):
+        # every track title codec has a title name that maps back to it
+        for title_names in [
+            self.codecs_parser.video_title_names,
+            self.codecs_parser.audio_title_names,
+        ]:
+            for codec, name in title_names.items():
+                self.assertEqual(
+                    self.codecs_parser.get_title_name_codec(name)[0], codec
+                )
+
+    def test_classify_title(self):
+        self.assertEqual(
+            self.codecs_parser.classify_title("Commentary / Dolby Digital Audio / 2.0"),
+            [
+                ("Commentary", None),
+                ("Dolby Digital Audio", "audio"),
+                ("2.0", None),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import json, os, sys, unittest
+
+# allow imports from the vdator directory
+VDATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "vdator")
+sys.path.append(VDATOR_DIR)
+
+from parsers import BDInfoParser, MediaInfoParser, PasteParser
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# mediainfo fields the checks read
+FIELDS = [
+    "id",
+    "format",
+    "format_version",
+    "commercial_name",
+    "title",
+    "language",
+    "default",
+    "forced",
+    "movie_name",
+    "complete_name",
+    "writing_application",
+    "imdb",
+    "tmdb",
+    "duration",
+    "width",
+    "height",
+    "display_aspect_ratio",
+    "frame_rate",
+    "scan_type",
+    "bit_rate",
+    "channels",
+    "sampling_rate",
+    "bit_depth",
+]
+
+# numeric fields parsed on the tracks
+NUMERIC_FIELDS = [
+    "height",
+    "fps",
+    "channels",
+    "bit_rate_kbps",
+    "sampling_rate_khz",
+    "bit_depth",
+]
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name)) as f:
+        return f.read()
+
+
+class TestMediaInfoFormats(unittest.TestCase):
+    def setUp(self):
+        self.paste_parser = PasteParser(BDInfoParser())
+        self.mediainfo_parser = MediaInfoParser()
+
+    def parse(self, paste):
+        _, mediainfo, _ = self.paste_parser.parse(paste)
+        return self.mediainfo_parser.parse(mediainfo)
+
+    def assertSameMediaInfo(self, mediainfo, expected):
+        for section in ["general", "video", "audio", "text"]:
+            self.assertEqual(len(mediainfo[section]), len(expected[section]), section)
+            for track, expected_track in zip(mediainfo[section], expected[section]):
+                for field in FIELDS:
+                    if field in expected_track:
+                        self.assertEqual(
+                            track.get(field),
+                            expected_track[field],
+                            section + " " + field,
+                        )
+                for field in NUMERIC_FIELDS:
+                    self.assertEqual(
+                        getattr(track, field),
+                        getattr(expected_track, field),
+                        section + " " + field,
+                    )
+        self.assertEqual(mediainfo["menu"], expected["menu"])
+
+    def test_json(self):
+        self.assertSameMediaInfo(
+            self.parse(read_fixture("mediainfo.json")),
+            self.parse(read_fixture("mediainfo.txt")),
+        )
+
+    def test_minified_json(self):
+        minified = json.dumps(json.loads(read_fixture("mediainfo.json")))
+        self.assertSameMediaInfo(
+            self.parse(minified), self.parse(read_fixture("mediainfo.txt"))
+        )
+
+    def test_xml(self):
+        self.assertSameMediaInfo(
+            self.parse(read_fixture("mediainfo.xml")),
+            self.parse(read_fixture("mediainfo.txt")),
+        )
+
+    def test_unfinished_json(self):
+        lines = read_fixture("mediainfo.json").splitlines()
+        with self.assertRaises(ValueError):
+            self.mediainfo_parser.parse(lines[:40])
+
+    def test_braces_are_not_mediainfo(self):
+        # json that isn't mediainfo doesn't start a mediainfo
+        paste = '{\n"name": "value"\n}\n' + read_fixture("mediainfo.txt")
+        _, mediainfo, _ = self.paste_parser.parse(paste)
+        self.assertEqual(mediainfo[0], "General")
+        self.assertSameMediaInfo(
+            self.mediainfo_parser.parse(mediainfo),
+            self.parse(read_fixture("mediainfo.txt")),
+        )
+
+    def test_unclosed_brace_is_not_mediainfo(self):
+        paste = "{ unclosed\n" + read_fixture("mediainfo.txt")
+        _, mediainfo, _ = self.paste_parser.parse(paste)
+        self.assertEqual(mediainfo[0], "General")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import os, sys, tempfile, unittest
+
+# allow imports from the vdator directory
+VDATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "vdator")
+sys.path.append(VDATOR_DIR)
+
+from people_index import PeopleIndex, build_index
+
+
+class TestPeopleIndex(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "people.sqlite")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_lookup(self):
+        build_index(["John Smith", "Jane Doe"], self.path)
+        people_index = PeopleIndex(self.path)
+        self.assertTrue(people_index.lookup("John Smith"))
+        self.assertTrue(people_index.lookup("jane  doe"))
+        self.assertFalse(people_index.lookup("Someone Else"))
+
+    def test_missing_index(self):
+        people_index = PeopleIndex(self.path)
+        self.assertFalse(people_index.lookup("John Smith"))
+        # the index is used once it's built
+        build_index(["John Smith"], self.path)
+        self.assertTrue(people_index.lookup("John Smith"))
+
+    def test_unreadable_index(self):
+        with open(self.path, "w") as f:
+            f.write("not a database")
+        self.assertFalse(PeopleIndex(self.path).lookup("John Smith"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import json, os, sys, unittest
+
+# allow imports from the vdator directory
+VDATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "vdator")
+sys.path.append(VDATOR_DIR)
+
+from parsers import CodecsParser
+from checks.remove_until_first_codec import RemoveUntilFirstCodec
+
+
+class TestRemoveUntilFirstCodec(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(VDATOR_DIR, "data/codecs.json")) as f:
+            self.remove_until_first_codec = RemoveUntilFirstCodec(
+                CodecsParser(json.load(f))
+            )
+
+    def remove(self, title):
+        return self.remove_until_first_codec.remove(title)
+
+    def test_no_separator(self):
+        self.assertEqual(
+            self.remove("Dolby Digital Audio"), ("Dolby Digital Audio", (), False)
+        )
+
+    def test_codec_first(self):
+        title = "DTS-HD Master Audio / 5.1 / 48 kHz / 3965 kbps / 24-bit"
+        self.assertEqual(self.remove(title), (title, (), True))
+
+    def test_parts_before_codec(self):
+        self.assertEqual(
+            self.remove("Commentary / Dolby Digital Audio / 2.0 / 48 kHz / 224 kbps"),
+            (
+                "Dolby Digital Audio / 2.0 / 48 kHz / 224 kbps",
+                ("Commentary",),
+                True,
+            ),
+        )
+
+    def test_trailing_separator(self):
+        # the rest of the title is stripped after every removed part
+        self.assertEqual(self.remove("A / B / "), ("", ("A", "B /", ""), False))
+
+    def test_empty_parts(self):
+        # an empty part shifts the removed parts, the codec is removed too
+        self.assertEqual(
+            self.remove("A /  / Dolby Digital Audio / 2.0"),
+            ("2.0", ("A", "/ Dolby Digital Audio"), True),
+        )
+
+    def test_whitespace_part(self):
+        self.assertEqual(self.remove("A /   / B"), ("", ("A", "/ B", ""), False))
+
+    def test_trailing_whitespace(self):
+        self.assertEqual(
+            self.remove("A / Dolby Digital Audio / 2.0 "),
+            ("Dolby Digital Audio / 2.0", ("A",), True),
+        )
+
+    def test_many_parts(self):
+        parts = tuple("Part " + str(i) for i in range(1000))
+        self.assertEqual(
+            self.remove(" / ".join(parts) + " / Dolby Digital Audio / 2.0"),
+            ("Dolby Digital Audio / 2.0", parts, True),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import os, sys, unittest
+
+# allow imports from the vdator directory
+VDATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "vdator")
+sys.path.append(VDATOR_DIR)
+
+from reporter import Reporter
+
+
+class TestReporter(unittest.TestCase):
+    def test_add_report(self):
+        reporter = Reporter()
+        reporter.add_report(
+            {"correct": 2, "warning": 1, "error": 0, "info": 0, "fail": 0}
+        )
+        reporter.add_report(
+            {"correct": 1, "warning": 0, "error": 3, "info": 1, "fail": 0}
+        )
+        self.assertEqual(
+            reporter.get_report(),
+            {"correct": 3, "warning": 1, "error": 3, "info": 1, "fail": 0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os, sys, unittest
+
+# allow imports from the vdator directory
+VDATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "vdator")
+sys.path.append(VDATOR_DIR)
+
+from reporter import Records, Reporter
+from result_cache import ResultCache
+from validation import ValidationPool
+
+
+class Job(object):
+    """
+    Validation job that reports an info, and optionally a failed lookup
+    """
+
+    def __init__(self, paste, lookup_failed=False):
+        self.paste = paste
+        self.channel_name = "bot"
+        self.lookup_failed = lookup_failed
+        self.runs = 0
+
+    def run(self):
+        self.runs += 1
+        reply = Records()
+        reporter = Reporter()
+        if self.lookup_failed:
+            reply += reporter.print_lookup_failure("Failed to get TMDb data for id")
+        else:
+            reply += reporter.print_report("info", "Not using mkvtoolnix")
+        return reply, reporter
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.pool = ValidationPool(pool_type="thread", workers=1, cache=ResultCache())
+
+    def tearDown(self):
+        self.pool.executor.shutdown()
+
+    def test_cached_reporter_is_a_copy(self):
+        job = Job("paste 1")
+        _, reporter = self.pool.submit(job).result()
+        # wait for the result to be cached
+        self.pool.executor.shutdown()
+        # changing a returned reporter doesn't change the cached result
+        reporter.print_report("warning", "Paste truncated")
+
+        reply, cached_reporter = self.pool.submit(job).result()
+        self.assertEqual(job.runs, 1)
+        self.assertIsNot(cached_reporter, reporter)
+        self.assertEqual(cached_reporter.get_report()["info"], 1)
+        self.assertEqual(cached_reporter.get_report()["warning"], 0)
+        self.assertEqual(reply[0].message, "Not using mkvtoolnix")
+
+    def test_failed_lookup_is_not_cached(self):
+        job = Job("paste 2", lookup_failed=True)
+        self.pool.submit(job).result()
+        self.pool.executor.shutdown()
+        self.assertEqual(self.pool.cache.stats()["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
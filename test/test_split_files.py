@@ -0,0 +1,85 @@
+import os, sys, unittest
+
+# allow imports from the vdator directory
+VDATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "vdator")
+sys.path.append(VDATOR_DIR)
+
+from parsers import BDInfoParser, PasteParser
+import parsers.paste_parser as paste_parser_module
+
+QUICK_SUMMARY = """Disc Title:     Some Show S01
+Video:          MPEG-4 AVC Video / 30000 kbps / 1080p / 23.976 fps / 16:9 / High Profile 4.1
+Audio:          English / DTS-HD Master Audio / 5.1 / 48 kHz / 3965 kbps / 24-bit
+"""
+
+EAC3TO_LOG = """eac3to v3.36, -test
+1: Chapters, 10 chapters
+2: h264/AVC, 1080p24 /1.001 (16:9)
+Done.
+"""
+
+
+def mediainfo(episode):
+    return (
+        "General\n"
+        "Complete name                            : Some.Show.S01E0"
+        + str(episode)
+        + ".mkv\n"
+        "Movie name                               : Some Show - S01E0"
+        + str(episode)
+        + "\n"
+    )
+
+
+class TestSplitFiles(unittest.TestCase):
+    def setUp(self):
+        self.paste_parser = PasteParser(BDInfoParser())
+        self.ignore_prefixes = paste_parser_module.IGNORE_PREFIXES
+
+    def tearDown(self):
+        paste_parser_module.IGNORE_PREFIXES = self.ignore_prefixes
+
+    def split(self, paste):
+        return self.paste_parser.split_files(paste)
+
+    def test_one_file_per_mediainfo(self):
+        files = self.split(QUICK_SUMMARY + "\n" + mediainfo(1) + "\n" + mediainfo(2))
+        self.assertEqual(len(files), 2)
+        self.assertEqual(files[1][0], "General")
+
+    def test_eac3to_log_starts_next_file(self):
+        files = self.split(
+            QUICK_SUMMARY
+            + "\n"
+            + EAC3TO_LOG
+            + "\n"
+            + mediainfo(1)
+            + "\n"
+            + EAC3TO_LOG
+            + "\n"
+            + mediainfo(2)
+        )
+        self.assertEqual(len(files), 2)
+        self.assertEqual(files[1][0], "eac3to v3.36, -test")
+        _, _, eac3to = self.paste_parser.parse(files[1])
+        self.assertEqual(len(eac3to), 1)
+
+    def test_trailing_bdinfo_stays_in_last_file(self):
+        files = self.split(mediainfo(1) + "\n" + mediainfo(2) + "\n" + QUICK_SUMMARY)
+        self.assertEqual(len(files), 2)
+        self.assertIn("Disc Title:     Some Show S01", files[1])
+
+    def test_ignored_lines_dont_split(self):
+        paste_parser_module.IGNORE_PREFIXES = ("note:",)
+        files = self.split(
+            mediainfo(1) + "Note: the next episode\n" + mediainfo(2) + "\n" + "Done"
+        )
+        self.assertEqual(len(files), 1)
+        _, lines, _ = self.paste_parser.parse(files[0])
+        self.assertNotIn(
+            "Movie name                               : Some Show - S01E02", lines
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+from concurrent.futures import Future
+import asyncio, os, sys, threading, unittest
+
+# allow imports from the vdator directory
+VDATOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "vdator")
+sys.path.append(VDATOR_DIR)
+
+from reporter import Records, Reporter
+from result_cache import ResultCache
+import validation
+from validation import ValidationJob, ValidationPool
+
+
+def done_job(job):
+    """
+    Finished job result, without running the checks
+
+    Parameters
+    ----------
+    job : ValidationJob
+        job to run
+
+    Returns
+    -------
+    concurrent.futures.Future of (Records reply, Reporter)
+    """
+    future = Future()
+    future.set_result((Records(), Reporter()))
+    return future
+
+
+class TestValidationPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = ValidationPool(pool_type="thread", workers=2, cache=ResultCache())
+        self.multi_file_mode = validation.MULTI_FILE_MODE
+        self.split_files = validation.paste_parser.split_files
+
+    def tearDown(self):
+        validation.MULTI_FILE_MODE = self.multi_file_mode
+        validation.paste_parser.split_files = self.split_files
+        self.pool.executor.shutdown()
+
+    def test_split_off_event_loop(self):
+        validation.MULTI_FILE_MODE = True
+        split_threads = list()
+
+        def split_files(paste):
+            split_threads.append(threading.current_thread())
+            return [paste]
+
+        validation.paste_parser.split_files = split_files
+        self.pool.submit = done_job
+
+        asyncio.run(self.pool.run_paste(["General"], "bot"))
+        self.assertEqual(len(split_threads), 1)
+        self.assertIsNot(split_threads[0], threading.main_thread())
+
+    def test_cache_key_off_event_loop(self):
+        key_threads = list()
+        key = self.pool.cache.key
+
+        def cache_key(paste, channel_name):
+            key_threads.append(threading.current_thread())
+            return key(paste, channel_name)
+
+        self.pool.cache.key = cache_key
+        self.pool.executor.submit = lambda fn: done_job(None)
+
+        asyncio.run(self.pool.run_paste(["General"], "bot"))
+        asyncio.run(self.pool.run(ValidationJob(["General"], "bot")))
+        self.assertEqual(len(key_threads), 2)
+        for thread in key_threads:
+            self.assertIsNot(thread, threading.main_thread())
+
+
+if __name__ == "__main__":
+    unittest.main()
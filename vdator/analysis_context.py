@@ -0,0 +1,110 @@
+from pydash import has
+import re
+
+from checks.mixins import IsCommentaryTrack
+
+
+class AnalysisContext(IsCommentaryTrack):
+    """
+    Facts about a paste that checks share.
+    Built once per paste by Checker.setup and read only,
+    every fact is computed before the checks run.
+    Numeric track fields are parsed on the mediainfo tracks, like mediainfo["video"][0].height
+    """
+
+    def __init__(
+        self, bdinfo, mediainfo, eac3to, source_detector, remove_until_first_codec
+    ):
+        """
+        Parameters
+        ----------
+        bdinfo : dict
+            bdinfo
+
+        mediainfo : dict
+            mediainfo
+
+        eac3to : list
+            eac3to logs
+
+        source_detector : SourceDetector
+            source detector set up with this paste
+
+        remove_until_first_codec : RemoveUntilFirstCodec
+            removes title parts before the first codec, remembers titles
+        """
+        # setattr is blocked
+        self.__dict__.update(
+            bdinfo=bdinfo,
+            mediainfo=mediainfo,
+            eac3to=eac3to,
+            source_detector=source_detector,
+            remove_until_first_codec=remove_until_first_codec,
+        )
+        self.__dict__.update(
+            # boolean True if the source is a DVD
+            is_dvd=source_detector.is_dvd(),
+            # boolean True if the source is an NTSC DVD
+            is_ntsc_dvd=source_detector.is_ntsc_dvd(),
+            # boolean True if the source is a PAL DVD
+            is_pal_dvd=source_detector.is_pal_dvd(),
+            # boolean True if the source is a UHD BluRay
+            is_uhd=source_detector.is_uhd(),
+            # boolean True if the source has dolby vision
+            is_dv=source_detector.is_dv(),
+            # boolean True if it's a movie, False if it's a tv show
+            is_movie=self._is_movie(),
+            # tuple of RemoveUntilFirstCodec.remove() results for every mediainfo audio track,
+            # (title starting at the first codec, removed parts, found codec),
+            # None for tracks without a title
+            audio_titles=tuple(
+                remove_until_first_codec.remove(track["title"])
+                if "title" in track
+                else None
+                for track in mediainfo["audio"]
+            ),
+            # tuple of booleans, True for mediainfo audio commentary tracks
+            audio_commentary=tuple(
+                self._is_commentary_track(track.get("title", ""))
+                for track in mediainfo["audio"]
+            ),
+            # tuple of booleans, True for mediainfo text commentary tracks
+            text_commentary=tuple(
+                self._is_commentary_track(track.get("title", ""))
+                for track in mediainfo["text"]
+            ),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AnalysisContext is read only")
+
+    def _is_movie(self):
+        """
+        Is it a movie or a tv show?
+
+        Returns
+        -------
+        boolean True if it's a movie, False if it's a tv show
+        """
+        # is it a movie or tv show? assume movie
+        is_movie = True
+        determined_movie_or_tv = False
+
+        if has(self.mediainfo, "general.0.tmdb"):
+            if self.mediainfo["general"][0]["tmdb"].startswith("movie/"):
+                is_movie = True
+                determined_movie_or_tv = True
+            elif self.mediainfo["general"][0]["tmdb"].startswith("tv/"):
+                is_movie = False
+                determined_movie_or_tv = True
+
+        if not determined_movie_or_tv:
+            if has(self.mediainfo, "general.0.movie_name"):
+                # tv show name in format "Name - S01E01" or "Name - S01E01E02"
+                is_tv = re.search(
+                    r"^.+\s-\sS\d{2}(E\d{2})+.*$",
+                    self.mediainfo["general"][0]["movie_name"],
+                )
+                if is_tv:
+                    is_movie = not (is_tv)
+        return is_movie
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark PasteParser.parse on large synthetic pastes
+
+Usage: python benchmarks/benchmark_paste_parser.py [--copies N] [--repeat N]
+"""
+
+import argparse, os, sys, timeit
+
+# allow imports from parent directory
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from parsers import BDInfoParser, PasteParser
+
+PLAYLIST_REPORT = """PLAYLIST REPORT:
+
+Name:                   00800.MPLS
+Length:                 1:52:13.123 (h:m:s.ms)
+Size:                   40,123,456,789 bytes
+Total Bitrate:          47.64 Mbps
+
+VIDEO:
+
+Codec                   Bitrate             Description
+-----                   -------             -----------
+MPEG-4 AVC Video        30000 kbps          1080p / 23.976 fps / 16:9 / High Profile 4.1
+
+AUDIO:
+
+Codec                           Language        Bitrate         Description
+-----                           --------        -------         -----------
+DTS-HD Master Audio             English         3965 kbps       5.1 / 48 kHz / 3965 kbps / 24-bit (DTS Core: 5.1 / 48 kHz / 1509 kbps / 24-bit)
+Dolby Digital Audio             English         224 kbps        2.0 / 48 kHz / 224 kbps / DN -27dB
+* Dolby Digital Audio           English         192 kbps        2.0 / 48 kHz / 192 kbps / DN -31dB
+
+SUBTITLES:
+
+Codec                           Language        Bitrate         Description
+-----                           --------        -------         -----------
+Presentation Graphics           English         33.123 kbps
+"""
+
+MEDIAINFO = """General
+Unique ID                                : 1234
+Complete name                            : Some.Movie.2001.1080p.BluRay.REMUX.AVC.DTS-HD.MA.5.1-GRouP.mkv
+Format                                   : Matroska
+Movie name                               : Some Movie (2001)
+Writing application                      : mkvmerge v57.0.0 ('Till The End') 64-bit
+
+Video
+ID                                       : 1
+Format                                   : AVC
+Height                                   : 1 080 pixels
+Frame rate                               : 23.976 (24000/1001) FPS
+Title                                    : MPEG-4 AVC Video / 30000 kbps / 1080p / 23.976 fps / 16:9 / High Profile 4.1
+Language                                 : English
+
+Audio
+ID                                       : 2
+Format                                   : DTS XLL
+Title                                    : DTS-HD Master Audio / 5.1 / 48 kHz / 3965 kbps / 24-bit
+Language                                 : English
+
+Text
+ID                                       : 3
+Format                                   : PGS
+Language                                 : English
+
+Menu
+00:00:00.000                             : en:Chapter 01
+00:05:00.000                             : en:Chapter 02
+"""
+
+EAC3TO_LOG = """eac3to v3.36, -test
+M2TS, 1 video track, 2 audio tracks, 1 subtitle track, 1:52:13, 24p /1.001
+1: Chapters, 24 chapters
+2: h264/AVC, 1080p24 /1.001 (16:9)
+3: DTS Master Audio, English, 5.1 channels, 24 bits, 48kHz
+   (core: DTS, 5.1 channels, 24 bits, 1509kbps, 48kHz)
+4: AC3, English, 2.0 channels, 224kbps, 48kHz, dialnorm: -27dB
+5: Subtitle (PGS), English
+Original audio track: max 24 bits, average 18 bits, most common 16 bits.
+Done.
+"""
+
+
+def synthetic_paste(copies):
+    """
+    Create a large paste with a playlist report, eac3to logs and mediainfo dumps
+
+    Parameters
+    ----------
+    copies : int
+        number of eac3to logs and mediainfo dumps
+
+    Returns
+    -------
+    str paste text
+    """
+    return (
+        PLAYLIST_REPORT
+        + "\n"
+        + "\n".join([EAC3TO_LOG + "\n" + MEDIAINFO for _ in range(copies)])
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark PasteParser.parse")
+    parser.add_argument(
+        "--copies", type=int, default=500, help="eac3to logs and mediainfo dumps"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    paste_parser = PasteParser(BDInfoParser())
+    text = synthetic_paste(args.copies)
+    num_lines = len(text.splitlines())
+
+    best = min(
+        timeit.repeat(lambda: paste_parser.parse(text), number=1, repeat=args.repeat)
+    )
+    print(
+        str(num_lines)
+        + " lines, best of "
+        + str(args.repeat)
+        + ": "
+        + "{:.4f}".format(best)
+        + "s, "
+        + "{:,.0f}".format(num_lines / best)
+        + " lines/s"
+    )
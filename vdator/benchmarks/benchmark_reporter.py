@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark the cost of formatting a reply, per report line
+
+Usage: python benchmarks/benchmark_reporter.py [--lines N] [--repeat N]
+"""
+
+import argparse, os, sys, timeit
+
+# allow imports from parent directory
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from reporter import REPORT_TYPES, Records, Reporter
+from renderers import render_discord
+
+
+def report(num_lines):
+    """
+    Create a reply like the checks do
+
+    Parameters
+    ----------
+    num_lines : int
+        number of report lines
+
+    Returns
+    -------
+    Records reply
+    """
+    reporter = Reporter()
+    reply = Records()
+    for i in range(num_lines):
+        reply += reporter.print_report(
+            REPORT_TYPES[i % len(REPORT_TYPES)],
+            "Audio #" + str(i) + ": Track names match",
+            track="#" + str(i),
+        )
+    return reply
+
+
+def print_result(name, num_lines, repeat, best):
+    """
+    Print the best time of a benchmark
+
+    Parameters
+    ----------
+    name : str
+        benchmark name
+
+    num_lines : int
+        number of report lines
+
+    repeat : int
+        number of runs
+
+    best : float
+        best time in seconds
+    """
+    print(
+        name
+        + ": "
+        + str(num_lines)
+        + " lines, best of "
+        + str(repeat)
+        + ": "
+        + "{:.4f}".format(best)
+        + "s, "
+        + "{:.3f}".format(best / num_lines * 1e6)
+        + " us/line"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark reply formatting")
+    parser.add_argument("--lines", type=int, default=100000, help="report lines")
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    best = min(timeit.repeat(lambda: report(args.lines), number=1, repeat=args.repeat))
+    print_result("print_report", args.lines, args.repeat, best)
+
+    reply = report(args.lines)
+    best = min(
+        timeit.repeat(lambda: render_discord(reply), number=1, repeat=args.repeat)
+    )
+    print_result("render_discord", args.lines, args.repeat, best)
@@ -1,30 +1,101 @@
 from dotenv import load_dotenv
-import logging, os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import logging, os, threading, traceback
 
 # load environment variables
 load_dotenv()
 
-# TMDb API
-import tmdbsimple as tmdb
+# max number of checks run at the same time (default: 8)
+CHECK_WORKERS = int(os.environ.get("CHECK_WORKERS", "8").strip())
+# seconds to wait for a TMDb/IMDb response (default: 10)
+API_TIMEOUT = float(os.environ.get("API_TIMEOUT", "10").strip())
 
-tmdb.API_KEY = os.environ.get("TMDB_API_KEY")
+# TMDb and IMDb APIs, loaded on first use
+_tmdb = None
+_ia = None
+_apis_lock = threading.Lock()
 
-# IMDb API
-from imdb import Cinemagoer
 
-ia = Cinemagoer()
-logger = logging.getLogger("imdbpy")
-logger.disabled = True
+def get_tmdb():
+    """
+    Get the TMDb API, load it on first use
+
+    Returns
+    -------
+    tmdbsimple module
+    """
+    global _tmdb
+    with _apis_lock:
+        if _tmdb is None:
+            import tmdbsimple as tmdb
+
+            tmdb.API_KEY = os.environ.get("TMDB_API_KEY")
+            tmdb.REQUESTS_TIMEOUT = API_TIMEOUT
+            _tmdb = tmdb
+        return _tmdb
+
+
+def get_ia():
+    """
+    Get the IMDb API, load it on first use
+
+    Returns
+    -------
+    imdb.Cinemagoer
+    """
+    global _ia
+    with _apis_lock:
+        if _ia is None:
+            from imdb import Cinemagoer
+
+            _ia = Cinemagoer(timeout=API_TIMEOUT)
+            logger = logging.getLogger("imdbpy")
+            logger.disabled = True
+        return _ia
+
+
+# IMDb/TMDb data cache
+from metadata_cache import MetadataCache
+
+metadata_cache = MetadataCache()
+
+# local index of person names
+from people_index import PEOPLE_INDEX_PATH, PeopleIndex
+
+people_index = PeopleIndex(PEOPLE_INDEX_PATH) if PEOPLE_INDEX_PATH else None
+
+# latest mkvtoolnix version
+from mkvtoolnix_version import MKVToolNixVersion
+
+mkvtoolnix_version = MKVToolNixVersion()
+
+# runs checks of all pastes
+check_executor = ThreadPoolExecutor(max_workers=CHECK_WORKERS)
 
 # checks
 from checks.mixins import PrintHeader, SectionId, IsCommentaryTrack
 from checks.remove_until_first_codec import RemoveUntilFirstCodec
+from analysis_context import AnalysisContext
+from reporter import Records
 from checks import *
+from checks.audio_track_spellcheck import get_hunspell
+from checks.chapter_language import load_langdetect
+
+# nltk models
+from nltk_people import load_models
 
-# nltk data
-from nltk_people import download_nltk_data
 
-download_nltk_data()
+def warm_up():
+    """
+    Load everything that is otherwise loaded by the first paste:
+    nltk data and models, IMDb and TMDb APIs, hunspell and langdetect.
+    Missing nltk data is downloaded.
+    """
+    for load in [load_models, get_tmdb, get_ia, get_hunspell, load_langdetect]:
+        try:
+            load()
+        except:
+            traceback.print_exc()
 
 
 class Checker(PrintHeader, SectionId, IsCommentaryTrack):
@@ -40,75 +111,176 @@ class Checker(PrintHeader, SectionId, IsCommentaryTrack):
         self.eac3to = eac3to
         self.channel_name = channel_name
         self.source_detector.setup(bdinfo, mediainfo)
-
-    def run_checks(self):
-        reply = ""
-
-        # check metadata
-        reply += self._print_header("Metadata")
-        reply += CheckMovieNameFormat(self.reporter, self.mediainfo).run()
-        reply += CheckMetadataIds(self.reporter, self.mediainfo, tmdb, ia).run()
-        reply += CheckFilename(
-            self.reporter,
-            self.source_detector,
-            self.codecs,
-            self.remove_until_first_codec,
-            self.mediainfo,
-            self.bdinfo,
-            self.channel_name,
-        ).run()
-        reply += CheckTracksHaveLanguage(self.reporter, self.mediainfo).run()
-        reply += CheckVideoLanguageMatchesFirstAudioLanguage(
-            self.reporter, self.mediainfo
-        ).run()
-        reply += CheckMuxingMode(self.reporter, self.mediainfo).run()
-        reply += CheckMKVMerge(self.reporter, self.mediainfo).run()
-        reply += CheckMetadataDefaultFlag(self.reporter, self.mediainfo).run()
-
-        # check video
-        reply += self._print_header("Video & Audio Tracks")
-        reply += CheckVideoTrack(
-            self.reporter,
-            self.source_detector,
-            self.codecs,
-            self.mediainfo,
-            self.bdinfo,
-        ).run()
-
-        # check audio
-        reply += CheckPrintAudioTrackNames(self.reporter, self.mediainfo).run()
-        reply += CheckAudioTrackConversions(
-            self.reporter,
+        # facts shared by the checks
+        self.context = AnalysisContext(
+            bdinfo,
+            mediainfo,
+            eac3to,
             self.source_detector,
-            self.codecs,
             self.remove_until_first_codec,
-            self.mediainfo,
-            self.bdinfo,
-            self.eac3to,
-        ).run()
-        # check FLAC audio using mediainfo
-        reply += CheckFLACAudioTracks(
-            self.reporter, self.remove_until_first_codec, self.mediainfo
-        ).run()
-
-        # TMDb and IMDb People API
-        reply += CheckAudioTrackPeople(
-            self.reporter, self.remove_until_first_codec, self.mediainfo, tmdb, ia
-        ).run()
-        reply += CheckAudioTrackSpellCheck(
-            self.reporter, self.remove_until_first_codec, self.mediainfo
-        ).run()
-
-        # check text
-        reply += self._print_header("Text Tracks")
-        reply += CheckPrintTextTracks(self.reporter, self.mediainfo).run()
-        reply += CheckTextOrder(self.reporter, self.mediainfo).run()
-        reply += CheckTextDefaultFlag(self.reporter, self.mediainfo).run()
-
-        # check chapters
-        reply += CheckPrintChapters(self.reporter, self.mediainfo).run()
-        reply += CheckHasChapters(self.reporter, self.mediainfo, self.eac3to).run()
-        reply += CheckChapterLanguage(self.reporter, self.mediainfo).run()
-        reply += CheckChapterPadding(self.reporter, self.mediainfo).run()
+        )
+
+    def _sections(self):
+        """
+        Get the checks to run, in the order their replies are shown
+
+        Returns
+        -------
+        list of (header, list of (check, list of check classes it depends on)) tuples
+        """
+        return [
+            (
+                "Metadata",
+                [
+                    (
+                        CheckMovieNameFormat(
+                            self.reporter, self.context, self.mediainfo
+                        ),
+                        [],
+                    ),
+                    # TMDb and IMDb API
+                    (
+                        CheckMetadataIds(
+                            self.reporter,
+                            self.context,
+                            self.mediainfo,
+                            get_tmdb(),
+                            get_ia(),
+                            metadata_cache,
+                        ),
+                        [],
+                    ),
+                    (
+                        CheckFilename(
+                            self.reporter,
+                            self.context,
+                            self.codecs,
+                            self.mediainfo,
+                            self.bdinfo,
+                            self.channel_name,
+                        ),
+                        [],
+                    ),
+                    (CheckTracksHaveLanguage(self.reporter, self.mediainfo), []),
+                    (
+                        CheckVideoLanguageMatchesFirstAudioLanguage(
+                            self.reporter, self.mediainfo
+                        ),
+                        [],
+                    ),
+                    (CheckMuxingMode(self.reporter, self.mediainfo), []),
+                    (
+                        CheckMKVMerge(
+                            self.reporter, self.mediainfo, mkvtoolnix_version
+                        ),
+                        [],
+                    ),
+                    (CheckMetadataDefaultFlag(self.reporter, self.mediainfo), []),
+                ],
+            ),
+            (
+                "Video & Audio Tracks",
+                [
+                    # check video
+                    (
+                        CheckVideoTrack(
+                            self.reporter,
+                            self.context,
+                            self.codecs,
+                            self.mediainfo,
+                            self.bdinfo,
+                        ),
+                        [],
+                    ),
+                    # check audio
+                    (CheckPrintAudioTrackNames(self.reporter, self.mediainfo), []),
+                    (
+                        CheckAudioTrackConversions(
+                            self.reporter,
+                            self.context,
+                            self.codecs,
+                            self.mediainfo,
+                            self.bdinfo,
+                            self.eac3to,
+                        ),
+                        [],
+                    ),
+                    # check FLAC audio using mediainfo
+                    (
+                        CheckFLACAudioTracks(
+                            self.reporter, self.context, self.mediainfo
+                        ),
+                        [],
+                    ),
+                    # TMDb and IMDb People API
+                    (
+                        CheckAudioTrackPeople(
+                            self.reporter,
+                            self.context,
+                            self.mediainfo,
+                            get_tmdb(),
+                            get_ia(),
+                            metadata_cache,
+                            people_index,
+                        ),
+                        [],
+                    ),
+                    (
+                        CheckAudioTrackSpellCheck(
+                            self.reporter, self.context, self.mediainfo
+                        ),
+                        [],
+                    ),
+                ],
+            ),
+            (
+                "Text Tracks",
+                [
+                    # check text
+                    (CheckPrintTextTracks(self.reporter, self.mediainfo), []),
+                    (CheckTextOrder(self.reporter, self.context, self.mediainfo), []),
+                    (CheckTextDefaultFlag(self.reporter, self.mediainfo), []),
+                    # check chapters
+                    (CheckPrintChapters(self.reporter, self.mediainfo), []),
+                    (
+                        CheckHasChapters(self.reporter, self.mediainfo, self.eac3to),
+                        [],
+                    ),
+                    (CheckChapterLanguage(self.reporter, self.mediainfo), []),
+                    (CheckChapterPadding(self.reporter, self.mediainfo), []),
+                ],
+            ),
+        ]
+
+    def run_checks(self):
+        """
+        Run all checks at the same time, a check only starts
+        after the checks it depends on are done
+
+        Returns
+        -------
+        Records reply, check replies in order under section headers
+        """
+        sections = self._sections()
+        waiting = [check for _, checks in sections for check in checks]
+        # check class -> reply
+        replies = dict()
+        running = dict()
+
+        while waiting or running:
+            for check, dependencies in list(waiting):
+                if all(d in replies for d in dependencies):
+                    running[check_executor.submit(check.run)] = type(check)
+                    waiting.remove((check, dependencies))
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                replies[running.pop(future)] = future.result()
 
+        reply = Records()
+        for header, checks in sections:
+            reply += self._print_header(header)
+            for check, _ in checks:
+                check_reply = replies[type(check)]
+                check_reply.set_origin(type(check).__name__, header)
+                reply += check_reply
         return reply
@@ -1,32 +1,30 @@
 from .check import *
-from .mixins import SectionId, IsCommentaryTrack
+from .mixins import SectionId
 
 import re
 
 
-class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
+class CheckAudioTrackConversions(Check, SectionId):
     def __init__(
         self,
         reporter,
-        source_detector,
+        context,
         codecs,
-        remove_until_first_codec,
         mediainfo,
         bdinfo,
         eac3to,
     ):
         super().__init__(reporter, mediainfo, "Error checking audio track conversions")
-        self.source_detector = source_detector
+        self.context = context
         self.codecs = codecs
-        self.remove_until_first_codec = remove_until_first_codec
         self.bdinfo = bdinfo
         self.eac3to = eac3to
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
-        if self.source_detector.is_dvd():
+        if self.context.is_dvd:
             # no audio track conversions for dvds
             reply += self.reporter.print_report(
                 "info", "No audio track conversions to check for DVDs"
@@ -97,7 +95,9 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                             mediainfo_audio_title,
                             _,
                             _,
-                        ) = self.remove_until_first_codec.remove(mediainfo_audio_title)
+                        ) = self.context.remove_until_first_codec.remove(
+                            mediainfo_audio_title
+                        )
 
                         bdinfo_audio_title = " / ".join(bdinfo_audio_parts_converted)
                         bdinfo_audio_titles = [bdinfo_audio_title]
@@ -135,6 +135,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                                 "Audio "
                                 + self._section_id("audio", i)
                                 + ": Track names match",
+                                track=self._section_id("audio", i),
                             )
                         else:
                             # use bitrate from mediainfo audio title
@@ -178,10 +179,13 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                                     + self.mediainfo["audio"][i]["title"]
                                     + "```",
                                     new_line=False,
+                                    track=self._section_id("audio", i),
                                 )
-                                reply += show_diff(
-                                    self.mediainfo["audio"][i]["title"],
-                                    bdinfo_audio_title,
+                                reply.hint(
+                                    show_diff(
+                                        self.mediainfo["audio"][i]["title"],
+                                        bdinfo_audio_title,
+                                    )
                                 )
                             else:
                                 reply += self.reporter.print_report(
@@ -189,6 +193,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                                     "Audio "
                                     + self._section_id("audio", i)
                                     + ": Track names match",
+                                    track=self._section_id("audio", i),
                                 )
                     else:
                         reply += self.reporter.print_report(
@@ -196,6 +201,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                             "Audio "
                             + self._section_id("audio", i)
                             + ": Missing track name",
+                            track=self._section_id("audio", i),
                         )
 
             if min_len < len_mediainfo:
@@ -207,9 +213,9 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
         return reply
 
     def _check_commentary(self, i):
-        reply, is_commentary = "", False
+        reply, is_commentary = Records(), False
 
-        if self._is_commentary_track(self.mediainfo["audio"][i]["title"]):
+        if self.context.audio_commentary[i]:
             is_commentary = True
             # audio = dict{'name':'...', 'language':'...'}
             if self.bdinfo["audio"][i]["name"].count("/") >= 1:
@@ -225,6 +231,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                                 "Audio "
                                 + self._section_id("audio", i)
                                 + ": Commentary already AC-3",
+                                track=self._section_id("audio", i),
                             )
                         else:
                             reply += self.reporter.print_report(
@@ -233,6 +240,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                                 + self._section_id("audio", i)
                                 + ": Commentary should be AC-3 instead of "
                                 + self.mediainfo["audio"][i]["format"],
+                                track=self._section_id("audio", i),
                             )
                     else:
                         reply += self.reporter.print_report(
@@ -240,6 +248,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                             "Audio "
                             + self._section_id("audio", i)
                             + ": Commentary does not have a format",
+                            track=self._section_id("audio", i),
                         )
 
                     return is_commentary, reply
@@ -249,6 +258,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                     "Audio #"
                     + self._section_id("audio", i)
                     + ": Cannot verify commentary audio conversion",
+                    track=self._section_id("audio", i),
                 )
                 return is_commentary, reply
 
@@ -257,15 +267,13 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                 and self.mediainfo["audio"][i]["format"] == "AC-3"
             ):
                 if "bit_rate" in self.mediainfo["audio"][i]:
-                    bit_rate = "".join(
-                        re.findall(r"[\d]+", self.mediainfo["audio"][i]["bit_rate"])
-                    )
-                    if bit_rate == "224":
+                    if self.mediainfo["audio"][i].bit_rate_kbps == 224:
                         reply += self.reporter.print_report(
                             "correct",
                             "Audio "
                             + self._section_id("audio", i)
                             + ": Commentary converted to `AC-3 @ 224 kbps`",
+                            track=self._section_id("audio", i),
                         )
                     else:
                         reply += self.reporter.print_report(
@@ -275,6 +283,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                             + ": Commentary AC-3 bitrate should be `224 kbps` instead of `"
                             + self.mediainfo["audio"][i]["bit_rate"]
                             + "`",
+                            track=self._section_id("audio", i),
                         )
                 else:
                     reply += self.reporter.print_report(
@@ -282,6 +291,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                         "Audio "
                         + self._section_id("audio", i)
                         + ": Commentary AC-3 does not have a bitrate",
+                        track=self._section_id("audio", i),
                     )
             else:
                 reply += self.reporter.print_report(
@@ -289,12 +299,13 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                     "Audio "
                     + self._section_id("audio", i)
                     + ": Commentary may be converted to AC-3",
+                    track=self._section_id("audio", i),
                 )
 
         return is_commentary, reply
 
     def _check_audio_conversion(self, i, audio_from, audio_to):
-        reply = ""
+        reply = Records()
 
         # verify audio track titles
         if (
@@ -303,7 +314,9 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
             or " / " not in self.mediainfo["audio"][i]["title"]
         ):
             reply += self.reporter.print_report(
-                "warning", "Could not verify audio " + self._section_id("audio", i)
+                "warning",
+                "Could not verify audio " + self._section_id("audio", i),
+                track=self._section_id("audio", i),
             )
             return reply
 
@@ -311,20 +324,21 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
         bdinfo_audio_parts = self.bdinfo["audio"][i]["name"].split(" / ")
         if len(bdinfo_audio_parts) <= 4:
             reply += self.reporter.print_report(
-                "warning", "Could not verify audio " + self._section_id("audio", i)
+                "warning",
+                "Could not verify audio " + self._section_id("audio", i),
+                track=self._section_id("audio", i),
             )
             return reply
 
-        mediainfo_audio_title = self.mediainfo["audio"][i]["title"]
-        (mediainfo_audio_title, _, _) = self.remove_until_first_codec.remove(
-            mediainfo_audio_title
-        )
+        (mediainfo_audio_title, _, _) = self.context.audio_titles[i]
 
         # [codec, channel, sampling rate, bit rate, bit depth]
         mediainfo_parts = mediainfo_audio_title.split(" / ")
         if len(mediainfo_parts) <= 4:
             reply += self.reporter.print_report(
-                "warning", "Could not verify audio " + self._section_id("audio", i)
+                "warning",
+                "Could not verify audio " + self._section_id("audio", i),
+                track=self._section_id("audio", i),
             )
             return reply
 
@@ -345,6 +359,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                     + "` instead of `"
                     + mediainfo_parts[1]
                     + "`",
+                    track=self._section_id("audio", i),
                 )
 
             # mediainfo bitrate should be less than bdinfo bitrate
@@ -367,6 +382,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                         + " kbps > "
                         + str(bd_bit_rate)
                         + " kbps`",
+                        track=self._section_id("audio", i),
                     )
             except ValueError:
                 pass
@@ -378,6 +394,7 @@ class CheckAudioTrackConversions(Check, SectionId, IsCommentaryTrack):
                 + " should be converted to one of ["
                 + ", ".join(audio_to)
                 + "]",
+                track=self._section_id("audio", i),
             )
 
         return reply
@@ -1,79 +1,221 @@
 from .check import *
 from .mixins import SectionId
 
+from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+import os, time
+
+from metadata_cache import MetadataNotFound
 from nltk_people import extract_names
 
+# load environment variables
+load_dotenv()
+
+# max number of TMDb/IMDb people searches at the same time (default: 8)
+PEOPLE_LOOKUP_WORKERS = int(os.environ.get("PEOPLE_LOOKUP_WORKERS", "8").strip())
+# seconds to wait for all people searches of a paste (default: 30)
+PEOPLE_LOOKUP_TIMEOUT = float(os.environ.get("PEOPLE_LOOKUP_TIMEOUT", "30").strip())
+
+# runs people searches of all pastes
+people_executor = ThreadPoolExecutor(max_workers=PEOPLE_LOOKUP_WORKERS)
+
 
 class CheckAudioTrackPeople(Check, SectionId):
-    def __init__(self, reporter, remove_until_first_codec, mediainfo, tmdb, ia):
+    def __init__(
+        self,
+        reporter,
+        context,
+        mediainfo,
+        tmdb,
+        ia,
+        metadata_cache,
+        people_index,
+    ):
         super().__init__(reporter, mediainfo, "Error checking IMDb/TMDb people")
-        self.remove_until_first_codec = remove_until_first_codec
+        self.context = context
         self.tmdb = tmdb
         self.ia = ia
+        self.metadata_cache = metadata_cache
+        # PeopleIndex or None
+        self.people_index = people_index
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
-        # check people in audio track names
+        # names in each audio track name
+        # [(audio track index, names), ...]
+        track_names = list()
         for i, _ in enumerate(self.mediainfo["audio"]):
             if "title" in self.mediainfo["audio"][i]:
                 title = self.mediainfo["audio"][i]["title"]
 
                 # skip if has an audio codec
-                _, _, found_codec = self.remove_until_first_codec.remove(title)
+                _, _, found_codec = self.context.audio_titles[i]
                 if found_codec:
                     continue
 
-                # try to match names
-                matched_names = list()
-                names = extract_names(title)
-                search = self.tmdb.Search()
-                for n in names:
-                    # TMDb API
-                    try:
-                        search.person(query=n)
-                        for s in search.results:
-                            if n == s["name"]:
-                                matched_names.append(n)
-                    except:
-                        reply += self.reporter.print_report(
-                            "info",
-                            "Audio "
-                            + self._section_id("audio", i)
-                            + ": Failed to get TMDb people data",
-                        )
-                    # IMDb API
-                    try:
-                        for person in self.ia.search_person(n):
-                            if n == person["name"]:
-                                matched_names.append(n)
-                    except:
-                        reply += self.reporter.print_report(
-                            "info",
-                            "Audio "
-                            + self._section_id("audio", i)
-                            + ": Failed to get IMDb people data",
-                        )
-                matched_names = set(matched_names)
-                if len(matched_names) > 0:
-                    reply += self.reporter.print_report(
-                        "correct",
+                track_names.append((i, extract_names(title)))
+
+        # search every name once, at the same time
+        # names in the local people index are not searched
+        indexed_names = set()
+        # name -> (TMDb future, IMDb future)
+        searches = dict()
+        for _, names in track_names:
+            for n in names:
+                if n in indexed_names or n in searches:
+                    continue
+                if self.people_index and self.people_index.lookup(n):
+                    indexed_names.add(n)
+                else:
+                    searches[n] = (
+                        people_executor.submit(
+                            self._lookup, "tmdb_person", n, self._search_tmdb
+                        ),
+                        people_executor.submit(
+                            self._lookup, "imdb_person", n, self._search_imdb
+                        ),
+                    )
+        deadline = time.monotonic() + PEOPLE_LOOKUP_TIMEOUT
+
+        # try to match names
+        for i, names in track_names:
+            matched_names = list()
+            for n in names:
+                if n in indexed_names:
+                    matched_names.append(n)
+                    continue
+                tmdb_search, imdb_search = searches[n]
+                # TMDb API
+                try:
+                    if self._search_result(tmdb_search, deadline):
+                        matched_names.append(n)
+                except:
+                    reply += self.reporter.print_lookup_failure(
                         "Audio "
                         + self._section_id("audio", i)
-                        + " People Matched: `"
-                        + ", ".join(matched_names)
-                        + "`",
+                        + ": Failed to get TMDb people data",
+                        track=self._section_id("audio", i),
                     )
-                unmatched_names = set(names) - set(matched_names)
-                if len(unmatched_names) > 0:
-                    reply += self.reporter.print_report(
-                        "warning",
+                # IMDb API
+                try:
+                    if self._search_result(imdb_search, deadline):
+                        matched_names.append(n)
+                except:
+                    reply += self.reporter.print_lookup_failure(
                         "Audio "
                         + self._section_id("audio", i)
-                        + " People Unmatched: `"
-                        + ", ".join(unmatched_names)
-                        + "`",
+                        + ": Failed to get IMDb people data",
+                        track=self._section_id("audio", i),
                     )
+            matched_names = set(matched_names)
+            if len(matched_names) > 0:
+                reply += self.reporter.print_report(
+                    "correct",
+                    "Audio "
+                    + self._section_id("audio", i)
+                    + " People Matched: `"
+                    + ", ".join(matched_names)
+                    + "`",
+                    track=self._section_id("audio", i),
+                )
+            unmatched_names = set(names) - set(matched_names)
+            if len(unmatched_names) > 0:
+                reply += self.reporter.print_report(
+                    "warning",
+                    "Audio "
+                    + self._section_id("audio", i)
+                    + " People Unmatched: `"
+                    + ", ".join(unmatched_names)
+                    + "`",
+                    track=self._section_id("audio", i),
+                )
 
         return reply
+
+    def _search_result(self, future, deadline):
+        """
+        Wait for a people search until the deadline
+
+        Parameters
+        ----------
+        future : concurrent.futures.Future
+            people search
+
+        deadline : float
+            time.monotonic() time to stop waiting at
+
+        Returns
+        -------
+        True if the person was found, False otherwise
+
+        Raises
+        ------
+        TimeoutError if the search is not done by the deadline,
+        or the search's exception
+        """
+        return future.result(timeout=max(0, deadline - time.monotonic()))
+
+    def _lookup(self, namespace, name, search):
+        """
+        Search for a person, or use the cached search result
+
+        Parameters
+        ----------
+        namespace : str
+            cache namespace, 'tmdb_person' or 'imdb_person'
+
+        name : str
+            person name
+
+        search : function
+            searches for the person, returns True if found
+
+        Returns
+        -------
+        True if a person has exactly this name, False otherwise
+        """
+
+        def fetch():
+            if not search(name):
+                # remember unmatched names
+                raise MetadataNotFound(name)
+            return True
+
+        try:
+            return self.metadata_cache.lookup(namespace, name, fetch)
+        except MetadataNotFound:
+            return False
+
+    def _search_tmdb(self, name):
+        """
+        Search TMDb for a person
+
+        Parameters
+        ----------
+        name : str
+            person name
+
+        Returns
+        -------
+        True if a person has exactly this name, False otherwise
+        """
+        search = self.tmdb.Search()
+        search.person(query=name)
+        return any(name == s["name"] for s in search.results)
+
+    def _search_imdb(self, name):
+        """
+        Search IMDb for a person
+
+        Parameters
+        ----------
+        name : str
+            person name
+
+        Returns
+        -------
+        True if a person has exactly this name, False otherwise
+        """
+        return any(name == person["name"] for person in self.ia.search_person(name))
@@ -2,56 +2,98 @@ from .check import *
 from .mixins import SectionId
 
 from dotenv import load_dotenv
-import nltk
-from nltk_people import extract_names
-import hunspell, os, string
+from functools import lru_cache
+from nltk_people import extract_names, word_tokenize
+import os, string, threading
 
 # load environment variables
 load_dotenv()
 
 HUNSPELL_LANG = [x.strip() for x in os.environ.get("HUNSPELL_LANG").split(",")]
-MISSPELLED_IGNORE_LIST = [
+MISSPELLED_IGNORE_LIST = frozenset(
     x.strip() for x in os.environ.get("MISSPELLED_IGNORE_LIST").split(",")
-]
+)
+# max number of words to remember the spelling of (default: 10000)
+SPELLCHECK_CACHE_SIZE = int(os.environ.get("SPELLCHECK_CACHE_SIZE", "10000").strip())
+
+# map punctuation to space
+PUNCTUATION_TRANSLATOR = str.maketrans(
+    string.punctuation, " " * len(string.punctuation)
+)
+
+# hunspell dictionary, loaded once per process
+_hobj = None
+_hobj_lock = threading.Lock()
+
+
+def get_hunspell():
+    """
+    Get the shared hunspell dictionary, load it on first use
+
+    Returns
+    -------
+    hunspell.HunSpell
+    """
+    global _hobj
+    with _hobj_lock:
+        if _hobj is None:
+            import hunspell
+
+            _hobj = hunspell.HunSpell(HUNSPELL_LANG[0], HUNSPELL_LANG[1])
+        return _hobj
+
+
+@lru_cache(maxsize=SPELLCHECK_CACHE_SIZE)
+def is_spelled_correctly(word):
+    """
+    Spellcheck a word, results are remembered
+
+    Parameters
+    ----------
+    word : str
+        word to check
+
+    Returns
+    -------
+    True if the word is spelled correctly, False otherwise
+    """
+    hobj = get_hunspell()
+    # hunspell is not thread safe
+    with _hobj_lock:
+        return hobj.spell(word)
 
 
 class CheckAudioTrackSpellCheck(Check, SectionId):
-    def __init__(self, reporter, remove_until_first_codec, mediainfo):
+    def __init__(self, reporter, context, mediainfo):
         super().__init__(reporter, mediainfo, "Error spell checking audio track names")
-        self.hobj = hunspell.HunSpell(HUNSPELL_LANG[0], HUNSPELL_LANG[1])
-        self.remove_until_first_codec = remove_until_first_codec
+        self.context = context
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         # spellcheck audio track names
         for i, _ in enumerate(self.mediainfo["audio"]):
             if "title" in self.mediainfo["audio"][i]:
-                title, title_parts, found_codec = self.remove_until_first_codec.remove(
-                    self.mediainfo["audio"][i]["title"]
-                )
+                title, title_parts, found_codec = self.context.audio_titles[i]
 
                 # spellcheck title parts before codec or entire audio title
                 spellcheck_text = " ".join(title_parts) if found_codec else title
                 if spellcheck_text:
                     # map punctuation to space
-                    translator = str.maketrans(
-                        string.punctuation, " " * len(string.punctuation)
-                    )
-                    spellcheck_text = spellcheck_text.translate(translator)
+                    spellcheck_text = spellcheck_text.translate(PUNCTUATION_TRANSLATOR)
 
                     # ignore names
                     ignore_list = extract_names(spellcheck_text)
-                    ignore_list = [a for b in ignore_list for a in b.split()]
+                    ignore_list = {a for b in ignore_list for a in b.split()}
 
                     # tokenize
-                    tokens = nltk.word_tokenize(spellcheck_text)
+                    tokens = word_tokenize(spellcheck_text)
                     tokens = [t for t in tokens if t not in ignore_list]
 
                     misspelled_words = list()
                     for t in tokens:
-                        if not self.hobj.spell(t):
+                        if not is_spelled_correctly(t):
                             # t is misspelled
                             misspelled_words.append(t)
 
@@ -69,6 +111,7 @@ class CheckAudioTrackSpellCheck(Check, SectionId):
                             + " Misspelled: `"
                             + ", ".join(misspelled_words)
                             + "`",
+                            track=self._section_id("audio", i),
                         )
 
         return reply
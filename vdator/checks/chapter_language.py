@@ -1,10 +1,32 @@
 from .check import *
 
 from iso639 import languages as iso639_languages
-from langdetect import detect as langdetect_detect, DetectorFactory
+import threading
 
-# make language detection deterministic
-DetectorFactory.seed = 0
+# langdetect, loaded on first use
+_langdetect_detect = None
+_langdetect_lock = threading.Lock()
+
+
+def load_langdetect():
+    """
+    Load the langdetect language profiles, only the first time this is called
+
+    Returns
+    -------
+    langdetect.detect function
+    """
+    global _langdetect_detect
+    with _langdetect_lock:
+        if _langdetect_detect is None:
+            from langdetect import detect, DetectorFactory
+            from langdetect.detector_factory import init_factory
+
+            # make language detection deterministic
+            DetectorFactory.seed = 0
+            init_factory()
+            _langdetect_detect = detect
+        return _langdetect_detect
 
 
 class CheckChapterLanguage(Check):
@@ -13,7 +35,7 @@ class CheckChapterLanguage(Check):
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         if "menu" in self.mediainfo and len(self.mediainfo["menu"]) > 0:
             if len(self.mediainfo["menu"]) >= 1:
@@ -49,13 +71,14 @@ class CheckChapterLanguage(Check):
 
                             for title in ch["titles"]:
                                 # store as key "NA" if there is no chapter language set
-                                if title["language"] is None:
-                                    title["language"] = "NA"
-                                if title["language"] not in chapter_phrases:
-                                    chapter_phrases[title["language"]] = ""
-                                chapter_phrases[title["language"]] += (
-                                    title["title"] + "\n"
+                                language = (
+                                    "NA"
+                                    if title["language"] is None
+                                    else title["language"]
                                 )
+                                if language not in chapter_phrases:
+                                    chapter_phrases[language] = ""
+                                chapter_phrases[language] += title["title"] + "\n"
 
                         if len(invalid_ch_lang_nums) > 0:
                             if len(invalid_ch_lang_nums) == len(chapters):
@@ -86,7 +109,7 @@ class CheckChapterLanguage(Check):
                             if chapter_phrase:
                                 chapter_langs[k] = list(set(chapter_langs[k]))
                                 try:
-                                    detected_lang = langdetect_detect(chapter_phrase)
+                                    detected_lang = load_langdetect()(chapter_phrase)
                                     ch_detected_lang = iso639_languages.get(
                                         part1=detected_lang
                                     )
@@ -9,7 +9,7 @@ class CheckChapterPadding(Check):
 
     # overriding abstract method
     def get_reply(self):
-        reply, padded_correctly = "", True
+        reply, padded_correctly = Records(), True
 
         if "menu" in self.mediainfo and len(self.mediainfo["menu"]) > 0:
             if len(self.mediainfo["menu"]) >= 1:
@@ -6,6 +6,7 @@ sys.path.append("../")
 from abc import abstractmethod
 from pydash import has
 from helpers import has_many, show_diff, is_float
+from reporter import Records, ReportRecord
 
 
 class Check(object):
@@ -21,9 +22,9 @@ class Check(object):
 
         Returns
         -------
-        reply string
+        Records reply
         """
-        reply = ""
+        reply = Records()
         try:
             reply += self.get_reply()
         except:
@@ -38,6 +39,6 @@ class Check(object):
 
         Returns
         -------
-        reply string
+        Records reply
         """
         pass
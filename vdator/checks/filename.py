@@ -1,4 +1,5 @@
 from .check import *
+from .mixins import MissingNumbers
 
 from dotenv import load_dotenv
 import os, re, string, unidecode
@@ -12,27 +13,35 @@ TRAINEE_CHANNELS = [x.strip() for x in os.environ.get("TRAINEE_CHANNELS").split(
 INTERNAL_CHANNELS = [x.strip() for x in os.environ.get("INTERNAL_CHANNELS").split(",")]
 
 
-class CheckFilename(Check):
+class CheckFilename(Check, MissingNumbers):
     def __init__(
         self,
         reporter,
-        source_detector,
+        context,
         codecs,
-        remove_until_first_codec,
         mediainfo,
         bdinfo,
         channel_name,
     ):
         super().__init__(reporter, mediainfo, "Error checking filename")
-        self.source_detector = source_detector
+        self.context = context
         self.codecs = codecs
-        self.remove_until_first_codec = remove_until_first_codec
         self.bdinfo = bdinfo
         self.channel_name = channel_name
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
+
+        if has(self.mediainfo, "video.0.height"):
+            missing = self._missing_numbers(self.mediainfo["video"][0], ["height"])
+            if missing:
+                reply += self.reporter.print_report(
+                    "error",
+                    "Cannot validate filename, missing or not a number in MediaInfo: "
+                    + missing,
+                )
+                return reply
 
         if has_many(self.mediainfo, "general.0", ["movie_name", "complete_name"]):
             complete_name = self.mediainfo["general"][0]["complete_name"]
@@ -83,7 +92,7 @@ class CheckFilename(Check):
                     + "```",
                     new_line=False,
                 )
-                reply += show_diff(complete_name, expected_release_name)
+                reply.hint(show_diff(complete_name, expected_release_name))
         else:
             reply += self.reporter.print_report("error", "Cannot validate filename")
 
@@ -92,7 +101,7 @@ class CheckFilename(Check):
     def _construct_release_name(self, cut=None, hybird=False, repack=False):
         release_name = ""
 
-        if not self.source_detector.is_dvd():
+        if not self.context.is_dvd:
             # scan type must come from bdinfo
             bdinfo_video_parts = self.bdinfo["video"][0].split(" / ")
             scan_type = bdinfo_video_parts[2].strip()[-1].lower()
@@ -135,20 +144,20 @@ class CheckFilename(Check):
                 release_name += "." + cut
 
             # resolution (ex. 1080p)
-            height = "".join(re.findall(r"[\d]+", self.mediainfo["video"][0]["height"]))
+            height = str(self.mediainfo["video"][0].height)
 
-            if self.source_detector.is_dvd():
+            if self.context.is_dvd:
                 # source DVD
                 if "standard" in self.mediainfo["video"][0]:
                     release_name += "." + self.mediainfo["video"][0]["standard"]
                 release_name += ".DVD.REMUX"
-            elif self.source_detector.is_uhd():
+            elif self.context.is_uhd:
                 # source UHD BluRay
                 release_name += "." + height
                 release_name += scan_type
                 release_name += ".UHD.BluRay.REMUX"
                 # Dolby Vision (DV)
-                if self.source_detector.is_dv():
+                if self.context.is_dv:
                     release_name += ".DV"
                 # SDR/HDR
                 if self.mediainfo["video"][0]["color_primaries"] == "BT.2020":
@@ -168,12 +177,7 @@ class CheckFilename(Check):
                     main_video_title[0].strip()
                 )
 
-            main_audio_title = self.mediainfo["audio"][0]["title"]
-            (
-                main_audio_title,
-                _,
-                _,
-            ) = self.remove_until_first_codec.remove(main_audio_title)
+            (main_audio_title, _, _) = self.context.audio_titles[0]
             main_audio_title_parts = main_audio_title.split(" / ")
 
             audio_codec_title, main_audio_channels = None, None
@@ -1,18 +1,16 @@
 from .check import *
-from .mixins import SectionId
+from .mixins import MissingNumbers, SectionId
 
-import re
 
-
-class CheckFLACAudioTracks(Check, SectionId):
-    def __init__(self, reporter, remove_until_first_codec, mediainfo):
+class CheckFLACAudioTracks(Check, SectionId, MissingNumbers):
+    def __init__(self, reporter, context, mediainfo):
         super().__init__(reporter, mediainfo, "Error checking FLAC audio tracks")
-        self.remove_until_first_codec = remove_until_first_codec
+        self.context = context
 
     # overriding abstract method
     def get_reply(self):
         # check FLAC Audio tracks using mediainfo
-        reply = ""
+        reply = Records()
 
         if len(self.mediainfo["audio"]) > 0:
             for i, audio_track in enumerate(self.mediainfo["audio"]):
@@ -21,50 +19,36 @@ class CheckFLACAudioTracks(Check, SectionId):
                     continue
 
                 # skip if no codec info
-                audio_title, _, found_codec = self.remove_until_first_codec.remove(
-                    audio_track["title"]
-                )
+                audio_title, _, found_codec = self.context.audio_titles[i]
                 if not found_codec:
                     continue
 
                 if "format" in audio_track and audio_track["format"] == "FLAC":
-                    channels = float(
-                        "".join(
-                            re.findall(
-                                r"\d*\.\d+|\d+", audio_track["channels"].strip().lower()
-                            )
-                        )
+                    missing = self._missing_numbers(
+                        audio_track,
+                        ["channels", "sampling_rate_khz", "bit_rate_kbps", "bit_depth"],
                     )
-                    sampling_rate = int(
-                        float(
-                            "".join(
-                                re.findall(
-                                    r"\d*\.\d+|\d+",
-                                    audio_track["sampling_rate"].strip().lower(),
-                                )
-                            )
-                        )
-                    )
-                    bit_rate = int(
-                        "".join(
-                            re.findall(r"\d+", audio_track["bit_rate"].strip().lower())
+                    if missing:
+                        reply += self.reporter.print_report(
+                            "warning",
+                            "Audio "
+                            + self._section_id("audio", i)
+                            + ": Cannot verify FLAC track name, missing or not a number in MediaInfo: "
+                            + missing,
+                            track=self._section_id("audio", i),
                         )
-                    )
-                    bit_depth = (
-                        audio_track["bit_depth"]
-                        .strip()
-                        .lower()
-                        .replace(" bits", "-bit")
-                    )
+                        continue
+
                     test_title = (
                         "FLAC Audio / "
-                        + "{:.1f}".format(channels)
+                        + "{:.1f}".format(audio_track.channels)
                         + " / "
-                        + str(sampling_rate)
+                        + str(int(audio_track.sampling_rate_khz))
                         + " kHz / "
-                        + str(bit_rate)
+                        + str(audio_track.bit_rate_kbps)
                         + " kbps / "
-                        + bit_depth
+                        + str(audio_track.bit_depth)
+                        + "-bit"
                     )
 
                     if test_title == audio_title:
@@ -73,6 +57,7 @@ class CheckFLACAudioTracks(Check, SectionId):
                             "Audio "
                             + self._section_id("audio", i)
                             + ": FLAC Good track name (from MediaInfo)",
+                            track=self._section_id("audio", i),
                         )
                     else:
                         reply += self.reporter.print_report(
@@ -85,6 +70,7 @@ class CheckFLACAudioTracks(Check, SectionId):
                             + test_title
                             + "```",
                             new_line=False,
+                            track=self._section_id("audio", i),
                         )
 
         return reply
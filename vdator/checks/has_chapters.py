@@ -8,7 +8,7 @@ class CheckHasChapters(Check):
 
     # overriding abstract method
     def get_reply(self):
-        reply, should_have_chapters = "", False
+        reply, should_have_chapters = Records(), False
         for log in self.eac3to:
             for l in log:
                 if "chapters" in l:
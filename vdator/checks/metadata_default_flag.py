@@ -8,7 +8,7 @@ class CheckMetadataDefaultFlag(Check):
     # overriding abstract method
     def get_reply(self):
         # only one track of each type should be default=yes
-        reply, default_yes_error = "", False
+        reply, default_yes_error = Records(), False
         track_types = ["audio", "text"]
 
         for track_type in track_types:
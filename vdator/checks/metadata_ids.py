@@ -1,9 +1,9 @@
 from .check import *
-from .mixins import IsMovie
 
 from dotenv import load_dotenv
-import datetime, os, re
-import imdb
+import datetime, os, re, requests
+
+from metadata_cache import MetadataNotFound
 
 # load environment variables
 load_dotenv()
@@ -12,15 +12,17 @@ load_dotenv()
 MOVIE_YEAR_OFFSET = int(os.environ.get("MOVIE_YEAR_OFFSET", "1").strip())
 
 
-class CheckMetadataIds(Check, IsMovie):
-    def __init__(self, reporter, mediainfo, tmdb, ia):
+class CheckMetadataIds(Check):
+    def __init__(self, reporter, context, mediainfo, tmdb, ia, metadata_cache):
         super().__init__(reporter, mediainfo, "Error parsing IMDb/TMDb ids")
+        self.context = context
         self.tmdb = tmdb
         self.ia = ia
+        self.metadata_cache = metadata_cache
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         imdb_movie, tmdb_info, tmdb_year = None, None, None
 
@@ -39,7 +41,7 @@ class CheckMetadataIds(Check, IsMovie):
         }
 
         # is it a movie or tv show?
-        is_movie = self._is_movie()
+        is_movie = self.context.is_movie
 
         # extract movie name and year or tv show name
         if has(self.mediainfo, "general.0.movie_name"):
@@ -64,16 +66,17 @@ class CheckMetadataIds(Check, IsMovie):
                 re.findall(r"[\d]+", self.mediainfo["general"][0]["imdb"])
             )
             try:
-                imdb_movie = self.ia.get_movie(imdb_id)
-            except imdb._exceptions.IMDbParserError:
+                imdb_movie = self.metadata_cache.lookup(
+                    "imdb", imdb_id, lambda: self._get_imdb_movie(imdb_id)
+                )
+            except MetadataNotFound:
                 reply += self.reporter.print_report(
                     "error",
                     "Invalid IMDb id: `" + self.mediainfo["general"][0]["imdb"] + "`",
                 )
             except:
                 # imdb._exceptions.IMDbDataAccessError
-                reply += self.reporter.print_report(
-                    "info",
+                reply += self.reporter.print_lookup_failure(
                     "Failed to get IMDb movie data for id: `"
                     + self.mediainfo["general"][0]["imdb"]
                     + "`",
@@ -91,17 +94,18 @@ class CheckMetadataIds(Check, IsMovie):
             tmdb_id = "".join(
                 re.findall(r"[\d]+", self.mediainfo["general"][0]["tmdb"])
             )
-            # movie or tv show
-            tmdb_data = self.tmdb.Movies(tmdb_id) if is_movie else self.tmdb.TV(tmdb_id)
-
             try:
-                tmdb_info = tmdb_data.info()
+                # movie or tv show
+                tmdb_info = self.metadata_cache.lookup(
+                    "tmdb_movie" if is_movie else "tmdb_tv",
+                    tmdb_id,
+                    lambda: self._get_tmdb_info(tmdb_id, is_movie),
+                )
                 # force single space in movie name
                 if "title" in tmdb_info:
                     tmdb_info["title"] = re.sub(r"\s+", " ", tmdb_info["title"])
             except:
-                reply += self.reporter.print_report(
-                    "info",
+                reply += self.reporter.print_lookup_failure(
                     "Failed to get TMDb data for id: `"
                     + self.mediainfo["general"][0]["tmdb"]
                     + "`",
@@ -154,8 +158,8 @@ class CheckMetadataIds(Check, IsMovie):
                                 "error", "IMDb: Name: `" + imdb_movie["title"] + "`"
                             )
                             if movie_data["name"]:
-                                reply += show_diff(
-                                    movie_data["name"], imdb_movie["title"]
+                                reply.hint(
+                                    show_diff(movie_data["name"], imdb_movie["title"])
                                 )
                             matched["title_replied"] = True
                         # tmdb_info["original_title"] is original title
@@ -165,8 +169,8 @@ class CheckMetadataIds(Check, IsMovie):
                                 "error", "TMDb: Name: `" + tmdb_info["title"] + "`"
                             )
                             if movie_data["name"]:
-                                reply += show_diff(
-                                    movie_data["name"], tmdb_info["title"]
+                                reply.hint(
+                                    show_diff(movie_data["name"], tmdb_info["title"])
                                 )
                             matched["title_replied"] = True
                         if not matched["title_replied"]:
@@ -217,6 +221,59 @@ class CheckMetadataIds(Check, IsMovie):
 
         return reply
 
+    def _get_imdb_movie(self, imdb_id):
+        """
+        Get IMDb title and year
+
+        Parameters
+        ----------
+        imdb_id : str
+            IMDb id without the tt prefix
+
+        Returns
+        -------
+        dict{'title':'...', 'year':int}
+        """
+        from imdb._exceptions import IMDbParserError
+
+        try:
+            imdb_movie = self.ia.get_movie(imdb_id)
+        except IMDbParserError:
+            raise MetadataNotFound(imdb_id)
+        # raises KeyError and skips caching if IMDb gave back nothing
+        imdb_data = {"title": imdb_movie["title"]}
+        if "year" in imdb_movie:
+            imdb_data["year"] = imdb_movie["year"]
+        return imdb_data
+
+    def _get_tmdb_info(self, tmdb_id, is_movie):
+        """
+        Get TMDb title, name and release date
+
+        Parameters
+        ----------
+        tmdb_id : str
+            TMDb id without the movie/ or tv/ prefix
+
+        is_movie : bool
+            True if movie, False if tv show
+
+        Returns
+        -------
+        dict with 'title', 'name', and 'release_date' keys if TMDb has them
+        """
+        # movie or tv show
+        tmdb_data = self.tmdb.Movies(tmdb_id) if is_movie else self.tmdb.TV(tmdb_id)
+        try:
+            tmdb_info = tmdb_data.info()
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                raise MetadataNotFound(tmdb_id)
+            raise
+        return {
+            k: tmdb_info[k] for k in ["title", "name", "release_date"] if k in tmdb_info
+        }
+
     def _year_range(self, year, test_year, offset=MOVIE_YEAR_OFFSET):
         # self._year_range(year, test_year)
         # example: with offset = 1, and year = 2004, test_year can be between 2003 and 2005 inclusive
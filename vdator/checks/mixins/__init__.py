@@ -1,4 +1,4 @@
 from .is_commentary_track import *
-from .is_movie import *
+from .missing_numbers import *
 from .print_header import *
 from .section_id import *
@@ -0,0 +1,33 @@
+# numeric track attribute -> mediainfo field
+NUMERIC_FIELDS = {
+    "height": "Height",
+    "fps": "Frame rate",
+    "channels": "Channel(s)",
+    "bit_rate_kbps": "Bit rate",
+    "sampling_rate_khz": "Sampling rate",
+    "bit_depth": "Bit depth",
+}
+
+
+class MissingNumbers(object):
+    def _missing_numbers(self, track, attributes):
+        """
+        Get the mediainfo fields of numeric track attributes that are missing or have no number
+
+        Parameters
+        ----------
+        track : MediaInfoTrack
+            mediainfo track
+
+        attributes : list
+            numeric track attributes, like ['height', 'fps']
+
+        Returns
+        -------
+        str mediainfo fields, like `Height`, `Frame rate`, empty if none are missing
+        """
+        return ", ".join(
+            "`" + NUMERIC_FIELDS[attribute] + "`"
+            for attribute in attributes
+            if getattr(track, attribute) is None
+        )
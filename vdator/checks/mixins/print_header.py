@@ -1,3 +1,11 @@
+import sys
+
+# allow imports from parent directory
+sys.path.append("../")
+
+from reporter import ReportRecord
+
+
 class PrintHeader(object):
     def _print_header(self, heading):
-        return "> **{}**\n".format(heading)
+        return ReportRecord("header", heading)
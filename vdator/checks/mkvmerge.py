@@ -1,7 +1,7 @@
 from .check import *
 
 from dotenv import load_dotenv
-import os, re, requests
+import os, re
 
 # load environment variables
 load_dotenv()
@@ -10,12 +10,13 @@ MKVMERGE_VERSION = os.environ.get("MKVMERGE_VERSION")
 
 
 class CheckMKVMerge(Check):
-    def __init__(self, reporter, mediainfo):
+    def __init__(self, reporter, mediainfo, mkvtoolnix_version):
         super().__init__(
             reporter,
             mediainfo,
             "Error checking mkvtoolnix version",
         )
+        self.mkvtoolnix_version = mkvtoolnix_version
 
     def run(self):
         """
@@ -24,9 +25,9 @@ class CheckMKVMerge(Check):
 
         Returns
         -------
-        reply string
+        Records reply
         """
-        reply = ""
+        reply = Records()
         try:
             reply += self.get_reply(MKVMERGE_VERSION)
         except:
@@ -38,7 +39,7 @@ class CheckMKVMerge(Check):
     # force_version = "Version 57.0.0 \"Till The End\" 2021-05-22"
     # force_version = "Version 76.0 \"Celebration\" 2023-04-30"
     def get_reply(self, force_version=None):
-        reply = ""
+        reply = Records()
 
         version_name_regex_mkvtoolnix = r'"(.*)"'
         version_name_regex_mediainfo = r"\'(.*)\'"
@@ -66,54 +67,53 @@ class CheckMKVMerge(Check):
             return reply
 
         try:
-            r = requests.get(os.environ.get("MKVTOOLNIX_NEWS"))
-            if r.status_code == 200:
-                ## Version 32.0.0 "Astral Progressions" 2019-03-12
-                ## Version 76.0 "Celebration" 2023-04-30
-                mkvtoolnix_version_line = r.text.splitlines()[0]
-                if force_version:
-                    mkvtoolnix_version_line = force_version
-
-                mkvtoolnix_version_num = re.search(
-                    version_num_regex, mkvtoolnix_version_line
-                )
-                if mkvtoolnix_version_num:
-                    mkvtoolnix_version_num = mkvtoolnix_version_num.group(1)
+            ## Version 32.0.0 "Astral Progressions" 2019-03-12
+            ## Version 76.0 "Celebration" 2023-04-30
+            if force_version:
+                mkvtoolnix_version_line = force_version
+            else:
+                mkvtoolnix_version_line = self.mkvtoolnix_version.get()
+
+            mkvtoolnix_version_num = re.search(
+                version_num_regex, mkvtoolnix_version_line
+            )
+            if mkvtoolnix_version_num:
+                mkvtoolnix_version_num = mkvtoolnix_version_num.group(1)
 
-                mkvtoolnix_version_name = re.search(
-                    version_name_regex_mkvtoolnix, mkvtoolnix_version_line
+            mkvtoolnix_version_name = re.search(
+                version_name_regex_mkvtoolnix, mkvtoolnix_version_line
+            )
+            if mkvtoolnix_version_name:
+                mkvtoolnix_version_name = mkvtoolnix_version_name.group(1)
+
+            if (
+                mkvtoolnix_version_num == mediainfo_version_num
+                and mkvtoolnix_version_name == mediainfo_version_name
+            ):
+                reply += self.reporter.print_report(
+                    "correct",
+                    "Uses latest mkvtoolnix: `"
+                    + mediainfo_version_num
+                    + ' "'
+                    + mediainfo_version_name
+                    + '"`',
+                )
+            else:
+                reply += self.reporter.print_report(
+                    "warning",
+                    "Not using latest mkvtoolnix: `"
+                    + mediainfo_version_num
+                    + ' "'
+                    + mediainfo_version_name
+                    + '"` latest is: `'
+                    + mkvtoolnix_version_num
+                    + ' "'
+                    + mkvtoolnix_version_name
+                    + '"`',
                 )
-                if mkvtoolnix_version_name:
-                    mkvtoolnix_version_name = mkvtoolnix_version_name.group(1)
-
-                if (
-                    mkvtoolnix_version_num == mediainfo_version_num
-                    and mkvtoolnix_version_name == mediainfo_version_name
-                ):
-                    reply += self.reporter.print_report(
-                        "correct",
-                        "Uses latest mkvtoolnix: `"
-                        + mediainfo_version_num
-                        + ' "'
-                        + mediainfo_version_name
-                        + '"`',
-                    )
-                else:
-                    reply += self.reporter.print_report(
-                        "warning",
-                        "Not using latest mkvtoolnix: `"
-                        + mediainfo_version_num
-                        + ' "'
-                        + mediainfo_version_name
-                        + '"` latest is: `'
-                        + mkvtoolnix_version_num
-                        + ' "'
-                        + mkvtoolnix_version_name
-                        + '"`',
-                    )
         except:
-            reply += self.reporter.print_report(
-                "info", "Could not fetch latest mkvtoolnix version"
+            reply += self.reporter.print_lookup_failure(
+                "Could not fetch latest mkvtoolnix version"
             )
             return reply
 
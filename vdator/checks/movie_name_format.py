@@ -1,19 +1,19 @@
 from .check import *
-from .mixins import IsMovie
 
 import re
 
 
-class CheckMovieNameFormat(Check, IsMovie):
-    def __init__(self, reporter, mediainfo):
+class CheckMovieNameFormat(Check):
+    def __init__(self, reporter, context, mediainfo):
         super().__init__(reporter, mediainfo, "Error parsing movie name")
+        self.context = context
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         # is it a movie or tv show?
-        is_movie = self._is_movie()
+        is_movie = self.context.is_movie
 
         if has(self.mediainfo, "general.0.movie_name"):
             if is_movie:
@@ -65,7 +65,7 @@ class CheckMovieNameFormat(Check, IsMovie):
         return reply
 
     def _movie_name_extra_space(self, movie_name):
-        reply = ""
+        reply = Records()
 
         if movie_name.startswith(" "):
             reply += self.reporter.print_report(
@@ -11,7 +11,7 @@ class CheckMuxingMode(Check):
 
     # overriding abstract method
     def get_reply(self):
-        reply, is_valid = "", True
+        reply, is_valid = Records(), True
 
         for section in ["general", "video", "audio", "text"]:
             for i, _ in enumerate(self.mediainfo[section]):
@@ -8,7 +8,7 @@ class CheckPrintAudioTrackNames(Check, SectionId):
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         if len(self.mediainfo["audio"]) > 0:
             reply += "Audio Track Names:\n"
@@ -19,6 +19,6 @@ class CheckPrintAudioTrackNames(Check, SectionId):
                     reply += self.mediainfo["audio"][i]["title"] + "\n"
             reply += "```"
         else:
-            reply = self.reporter.print_report("error", "No audio tracks")
+            reply += self.reporter.print_report("error", "No audio tracks")
 
         return reply
@@ -9,11 +9,11 @@ class CheckPrintChapters(Check):
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         if len(self.mediainfo["menu"]) > 0:
             for i, menu in enumerate(self.mediainfo["menu"]):
-                reply += f"> **Chapters {i + 1}**\n"
+                reply += ReportRecord("header", f"Chapters {i + 1}")
                 numbered_chapters = True
                 for ch in menu:
                     for title in ch["titles"]:
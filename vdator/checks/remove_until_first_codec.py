@@ -1,19 +1,87 @@
+from functools import lru_cache
+
+# max number of titles to remember per paste
+TITLE_CACHE_SIZE = 1024
+
+
 class RemoveUntilFirstCodec(object):
     def __init__(self, codecs):
         self.codecs = codecs
+        # remember titles, checks ask about the same audio titles
+        self.remove = lru_cache(maxsize=TITLE_CACHE_SIZE)(self._remove)
+
+    def _remove(self, title):
+        """
+        Remove the parts of a title before the first audio codec
+
+        Parameters
+        ----------
+        title : str
+            track title, parts separated by ' / '
+
+        Returns
+        -------
+        rest of the title, tuple of removed parts, True if a codec was found.
+        Results are shared between checks, so the removed parts are a tuple.
+        """
+        if " / " not in title:
+            return title, (), False
+        classified = self.codecs.classify_title(title)
+        parts = [part for part, _ in classified]
+        # parts before the first codec are removed
+        first = next(
+            (
+                i
+                for i, (_, track_type) in enumerate(classified)
+                if track_type == "audio"
+            ),
+            len(parts),
+        )
+        found = first < len(parts)
+        if first == 0:
+            return title, (), found
+
+        # the rest of the title is stripped after every removed part,
+        # which only changes the parts if they are empty or start with whitespace,
+        # or if the title ends with whitespace
+        if title[-1].isspace() or any(
+            not part or part[0].isspace() for part in parts[1 : first + 1]
+        ):
+            title2, title_parts = self._remove_stripped(title, first)
+            return title2, title_parts, found
+
+        return " / ".join(parts[first:]), tuple(parts[:first]), found
+
+    def _remove_stripped(self, title, count):
+        """
+        Remove parts from the start of a title, stripping the rest of the title
+        after every removed part
+
+        Parameters
+        ----------
+        title : str
+            track title, parts separated by ' / '
+
+        count : int
+            number of parts to remove
 
-    def remove(self, title):
-        title2, title_parts, found = title, list(), False
-        if " / " in title:
-            for part in title.split(" / "):
-                if self.codecs.is_audio_title(part):
-                    # stop when we get first codec
-                    found = True
-                    break
-                else:
-                    title2_split = title2.split(" / ")
-                    # remove part since its not a codec
-                    title2 = " / ".join(title2_split[1:]).strip()
-                    # save part in list
-                    title_parts.append(title2_split[0])
-        return title2, title_parts, found
+        Returns
+        -------
+        rest of the title, tuple of removed parts
+        """
+        # the rest of the title is title[start:end]
+        start, end, title_parts = 0, len(title), list()
+        for _ in range(count):
+            sep = title.find(" / ", start, end)
+            if sep == -1:
+                # last part
+                title_parts.append(title[start:end])
+                start = end
+                continue
+            title_parts.append(title[start:sep])
+            start = sep + 3
+            while start < end and title[start].isspace():
+                start += 1
+            while end > start and title[end - 1].isspace():
+                end -= 1
+        return title[start:end], tuple(title_parts)
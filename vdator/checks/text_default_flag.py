@@ -8,7 +8,7 @@ class CheckTextDefaultFlag(Check):
     # overriding abstract method
     def get_reply(self):
         # english subs for foreign films should be default=yes
-        reply = ""
+        reply = Records()
 
         if len(self.mediainfo["text"]) > 0:
             first_audio_language, has_english_subs, english_subs_default_yes = (
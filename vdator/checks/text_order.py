@@ -1,11 +1,11 @@
 from .check import *
-from .mixins import IsCommentaryTrack, SectionId
+from .mixins import SectionId
 
 from collections import OrderedDict
 import re
 
 
-class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
+class CheckTextOrder(Check, SectionId):
     """
     Checks text track order:
     Languages are in alphabetical order with English first
@@ -13,16 +13,17 @@ class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
     Commentary subtitles after regular subtitles
     """
 
-    def __init__(self, reporter, mediainfo):
+    def __init__(self, reporter, context, mediainfo):
         super().__init__(
             reporter,
             mediainfo,
             "Error checking text track order",
         )
+        self.context = context
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         if len(self.mediainfo["text"]) == 0:
             return reply
@@ -46,8 +47,7 @@ class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
 
         # get tracks by language, and separate commentary tracks
         for i, text in enumerate(self.mediainfo["text"]):
-            text["title"] = text["title"] if "title" in text else ""
-            if self._is_commentary_track(text["title"]):
+            if self.context.text_commentary[i]:
                 commentary_tracks_by_lang[self._format_lang(text["language"])].append(
                     text
                 )
@@ -82,6 +82,12 @@ class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
 
         return reply
 
+    def _title(self, text_track):
+        """
+        Get a text track title, or "" if it has no title
+        """
+        return text_track.get("title", "")
+
     def _format_lang(self, lang):
         """
         Format a text language to remove parenthesis
@@ -94,14 +100,14 @@ class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
         Forced english track should be first
         Only checks tracks without titles, since titles have a predefined order: No title, SDH, alphabetical
         """
-        reply = ""
+        reply = Records()
 
         is_forced_track = (
             text_track["forced"].lower() == "yes" if "forced" in text_track else False
         )
         is_english_track = text_track["language"].lower() == "english"
         # only checks tracks without titles
-        title_is_blank = text_track["title"] == ""
+        title_is_blank = self._title(text_track) == ""
         is_first_track = i == 0
 
         if (
@@ -116,13 +122,14 @@ class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
                 "Text {} is a forced English track, it should be first".format(
                     self._section_id("text", i)
                 ),
+                track=self._section_id("text", i),
             )
 
         return reply
 
     def _languages_in_order(self, text_tracks_by_lang, prefix=""):
         """Languages should be in alphabetical order with English first"""
-        reply = ""
+        reply = Records()
         text_track_langs_order = list(text_tracks_by_lang.keys())
         text_track_langs_expected_order = self._sort_sub_langs(text_track_langs_order)
 
@@ -144,7 +151,7 @@ class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
 
     def _commentary_last(self, text_tracks_by_lang, commentary_tracks_by_lang):
         """Commentary tracks should be last"""
-        reply = ""
+        reply = Records()
 
         if len(commentary_tracks_by_lang) > 0:
             last_text_id = self._get_last_text_id(text_tracks_by_lang)
@@ -177,7 +184,7 @@ class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
         Subtitles in order within language
         No title, SDH, rest in alphabetical order
         """
-        reply = ""
+        reply = Records()
         for k, v in text_tracks_by_lang.items():
             # k = 'English'
             # v = tracks list [{}, ...]
@@ -238,24 +245,24 @@ class CheckTextOrder(Check, IsCommentaryTrack, SectionId):
 
         # add tracks with no title
         for track in unparsed:
-            if track["title"] == "":
+            if self._title(track) == "":
                 parsed.append(track)
-        unparsed = [track for track in unparsed if track["title"] != ""]
+        unparsed = [track for track in unparsed if self._title(track) != ""]
 
         # add tracks with SDH
         tracks_with_SDH = []
         for track in unparsed:
-            if "SDH" in track["title"].split():
+            if "SDH" in self._title(track).split():
                 tracks_with_SDH.append(track)
-        tracks_with_SDH = sorted(tracks_with_SDH, key=lambda track: track["title"])
+        tracks_with_SDH = sorted(tracks_with_SDH, key=lambda track: self._title(track))
         if tracks_with_SDH:
             parsed.extend(tracks_with_SDH)
             unparsed = [
-                track for track in unparsed if ("SDH" not in track["title"].split())
+                track for track in unparsed if ("SDH" not in self._title(track).split())
             ]
 
         # sort rest of the tracks in alphabetical order
-        unparsed = sorted(unparsed, key=lambda track: track["title"])
+        unparsed = sorted(unparsed, key=lambda track: self._title(track))
 
         # add the rest of the tracks
         if unparsed:
@@ -8,7 +8,7 @@ class CheckTracksHaveLanguage(Check, SectionId):
 
     # overriding abstract method
     def get_reply(self):
-        reply, is_valid = "", True
+        reply, is_valid = Records(), True
 
         for section in ["video", "audio", "text"]:
             for i, _ in enumerate(self.mediainfo[section]):
@@ -19,6 +19,7 @@ class CheckTracksHaveLanguage(Check, SectionId):
                         + " "
                         + self._section_id(section, i)
                         + ": Does not have a language chosen",
+                        track=self._section_id(section, i),
                     )
                     is_valid = False
 
@@ -11,7 +11,7 @@ class CheckVideoLanguageMatchesFirstAudioLanguage(Check):
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         if not has(self.mediainfo, "video.0.language"):
             reply += self.reporter.print_report("error", "Video language not set")
@@ -1,18 +1,19 @@
 from .check import *
+from .mixins import MissingNumbers
 
 import re
 
 
-class CheckVideoTrack(Check):
-    def __init__(self, reporter, source_detector, codecs, mediainfo, bdinfo):
+class CheckVideoTrack(Check, MissingNumbers):
+    def __init__(self, reporter, context, codecs, mediainfo, bdinfo):
         super().__init__(reporter, mediainfo, "Error checking video track name")
-        self.source_detector = source_detector
+        self.context = context
         self.codecs = codecs
         self.bdinfo = bdinfo
 
     # overriding abstract method
     def get_reply(self):
-        reply = ""
+        reply = Records()
 
         if (
             has_many(
@@ -29,8 +30,19 @@ class CheckVideoTrack(Check):
                     "title",
                 ],
             )
-            and self.source_detector.is_dvd()
+            and self.context.is_dvd
         ):
+            missing = self._missing_numbers(
+                self.mediainfo["video"][0], ["bit_rate_kbps", "height", "fps"]
+            )
+            if missing:
+                reply += self.reporter.print_report(
+                    "warning",
+                    "Cannot verify video track name, missing or not a number in MediaInfo: "
+                    + missing,
+                )
+                return reply
+
             # dvd video title from mediainfo
             video_title = self._dvd_video_title_from_mediainfo()
             mediainfo_title = self.mediainfo["video"][0]["title"]
@@ -51,7 +63,7 @@ class CheckVideoTrack(Check):
                     + "```",
                     new_line=False,
                 )
-                reply += show_diff(mediainfo_title, video_title)
+                reply.hint(show_diff(mediainfo_title, video_title))
 
         elif has(self.bdinfo, "video") and has(self.mediainfo, "video"):
             if len(self.bdinfo["video"]) < 1:
@@ -80,7 +92,7 @@ class CheckVideoTrack(Check):
                     bdinfo_video_title = re.sub(
                         r"(\d+)\skbps", percise_kbps, bdinfo_video_title
                     )
-                if self.source_detector.is_dv() and mediainfo_video_title.startswith(
+                if self.context.is_dv and mediainfo_video_title.startswith(
                     bdinfo_video_title
                 ):
                     # if source is dolby vision, only check that the first part of mediainfo video title
@@ -106,7 +118,7 @@ class CheckVideoTrack(Check):
                         + "```",
                         new_line=False,
                     )
-                    reply += show_diff(mediainfo_video_title, bdinfo_video_title)
+                    reply.hint(show_diff(mediainfo_video_title, bdinfo_video_title))
             else:
                 reply += self.reporter.print_report(
                     "error", "Missing mediainfo video track"
@@ -131,16 +143,11 @@ class CheckVideoTrack(Check):
         video_title += " Video / "
 
         # bitrate
-        video_title += (
-            "".join(re.findall(r"[\d]+", self.mediainfo["video"][0]["bit_rate"]))
-            + " kbps"
-        )
+        video_title += str(self.mediainfo["video"][0].bit_rate_kbps) + " kbps"
         video_title += " / "
 
         # height
-        video_title += "".join(
-            re.findall(r"[\d]+", self.mediainfo["video"][0]["height"])
-        )
+        video_title += str(self.mediainfo["video"][0].height)
 
         # scan type
         (scan_type, _) = self.codecs.get_scan_type_title_name(
@@ -150,9 +157,7 @@ class CheckVideoTrack(Check):
         video_title += " / "
 
         # fps
-        video_fps = float(
-            "".join(re.findall(r"\d+\.\d+", self.mediainfo["video"][0]["frame_rate"]))
-        )
+        video_fps = self.mediainfo["video"][0].fps
         if video_fps.is_integer():
             video_fps = int(video_fps)
         video_title += str(video_fps) + " fps / "
@@ -165,7 +170,7 @@ class CheckVideoTrack(Check):
     def _actually_progressive(self):
         # dictionary existence already checked
 
-        reply = ""
+        reply = Records()
 
         bdinfo_video_title = self.bdinfo["video"][0]
         bdinfo_video_parts = bdinfo_video_title.split(" / ")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 from dotenv import load_dotenv
-import json, os, requests, traceback
+import asyncio, json, os, traceback
 
 # APIs
 import discord
@@ -9,11 +9,11 @@ from discord.utils import get
 
 # parsers
 from helpers import balanced_blockquotes, split_string
-from parsers import *
-from source_detector import SourceDetector
-from reporter import Reporter, add_status_reactions
-from checker import Checker
-from checks.remove_until_first_codec import RemoveUntilFirstCodec
+from paste_fetcher import PASTE_MAX_BYTES, PasteFetcher
+from parsers import URLParser
+from renderers import render_discord
+from reporter import Records, Reporter, add_status_reactions
+from validation import ValidationPool
 
 
 # script location
@@ -24,17 +24,8 @@ with open(os.path.join(__location__, "data/urls.json")) as f:
     urls = json.load(f)["urls"]
     url_parser = URLParser(urls)
 
-bdinfo_parser = BDInfoParser()
-paste_parser = PasteParser(bdinfo_parser)
-mediainfo_parser = MediaInfoParser()
-
-with open(os.path.join(__location__, "data/codecs.json")) as f:
-    codecs = json.load(f)
-    codecs_parser = CodecsParser(codecs)
-
-source_detector = SourceDetector()
-reporter = Reporter()
-checker = Checker(codecs_parser, source_detector, reporter)
+paste_fetcher = PasteFetcher()
+validation_pool = ValidationPool()
 
 # load environment variables
 load_dotenv()
@@ -61,6 +52,7 @@ def print_help():
     return (
         "vdator " + VERSION + " help: "
         "I take a Pastebin link with BDInfo and MediaInfo dump."
+        " MediaInfo can be text, JSON or XML output."
         " I ignore all input after the line `" + IGNORE_AFTER_LINE + "`."
         " I add reactions in the following review channels: `"
         + ", ".join(REVIEW_CHANNELS)
@@ -109,6 +101,52 @@ async def on_ready():
     print("I'm in")
     print(client.user)
     await client.change_presence(activity=discord.Game(name=IN_GAME))
+    # load nltk, IMDb, TMDb, etc. now instead of on the first paste
+    validation_pool.warm_up()
+
+
+async def validate_paste(url, channel_name):
+    """
+    Get and validate a paste
+
+    Parameters
+    ----------
+    url : str
+        url to raw paste
+
+    channel_name : str
+        name of the channel the paste was sent in
+
+    Returns
+    -------
+    str reply, report results dict from Reporter.get_report()
+    """
+    reply = Records()
+    reply += "<" + url + ">" + "\n"
+    reporter = Reporter()
+
+    try:
+        # get paste
+        paste, truncated = await paste_fetcher.get_lines(url)
+    except:
+        traceback.print_exc()
+        reply += reporter.print_report("fail", "Failed to get paste")
+    else:
+        if truncated:
+            reply += reporter.print_report(
+                "warning",
+                "Paste truncated at "
+                + str(PASTE_MAX_BYTES)
+                + " bytes, the rest was not checked",
+            )
+        # validate paste in the worker pool
+        job_reply, job_reporter = await validation_pool.run_paste(paste, channel_name)
+        reply += job_reply
+        reporter.add_report(job_reporter.get_report())
+
+    # report
+    reply += reporter.summary()
+    return render_discord(reply), reporter.get_report()
 
 
 @client.event
@@ -150,92 +188,18 @@ async def on_message(message):
         await channel.send(reply)
         return
 
-    # self
+    # ignore own messages
     if message.author == client.user:
-        # add status reactions to own messages
-        await add_status_reactions(message, message.content)
         return
 
     supported_urls = url_parser.extract_supported_urls(message.content)
 
-    for url in supported_urls:
-        reply = "<" + url + ">" + "\n"
-
-        try:
-            # setup/reset reporter
-            reporter.setup()
-            # get paste
-            r = requests.get(url)
-            r.raise_for_status()
-            paste = r.text
-        except:
-            traceback.print_exc()
-            reply += reporter.print_report("fail", "Failed to get paste")
-        else:
-            try:
-                (bdinfo, mediainfo, eac3to) = paste_parser.parse(paste)
-            except:
-                traceback.print_exc()
-                reply += reporter.print_report("fail", "Paste parser failed")
-            else:
-                if mediainfo:
-                    try:
-                        # parse mediainfo
-                        mediainfo = mediainfo_parser.parse(mediainfo)
-                    except:
-                        traceback.print_exc()
-                        reply += reporter.print_report(
-                            "fail", "Mediainfo parser failed"
-                        )
-                    else:
-                        try:
-                            remove_until_first_codec = RemoveUntilFirstCodec(
-                                codecs_parser
-                            )
-                            match_bdinfo_audio_to_mediainfo = (
-                                MatchBDInfoAudioToMediaInfo(
-                                    remove_until_first_codec, bdinfo, mediainfo
-                                )
-                            )
-                            bdinfo[
-                                "audio"
-                            ] = (
-                                match_bdinfo_audio_to_mediainfo.match_bdinfo_audio_to_mediainfo()
-                            )
-                            bdinfo["audio"] = bdinfo_parser.expand_compat_tracks(
-                                bdinfo["audio"]
-                            )
-                        except:
-                            traceback.print_exc()
-                            reply += reporter.print_report(
-                                "fail", "Matching bdinfo audio tracks to mediainfo"
-                            )
-                        else:
-                            try:
-                                # setup checker
-                                checker.setup(bdinfo, mediainfo, eac3to, channel_name)
-                            except:
-                                traceback.print_exc()
-                                reply += reporter.print_report(
-                                    "fail", "vdator failed to setup checker"
-                                )
-                            else:
-                                try:
-                                    reply += checker.run_checks()
-                                except:
-                                    traceback.print_exc()
-                                    reply += reporter.print_report(
-                                        "fail", "vdator failed to parse"
-                                    )
-                else:
-                    reply += reporter.print_report(
-                        "error", "No mediainfo. Are you missing the `General` heading?"
-                    )
-
-        # report
-        reply += "> **Report**\n"
-        reply += reporter.display_report()
+    # get and validate all pastes at the same time, replies keep the url order
+    paste_replies = await asyncio.gather(
+        *[validate_paste(url, channel_name) for url in supported_urls]
+    )
 
+    for reply, report in paste_replies:
         # split into multiple messages based on reply length
         BLOCK_QUOTES = "```"
         len_limit = (
@@ -258,10 +222,12 @@ async def on_message(message):
         if channel_name in BOT_CHANNELS:
             # reply in bot channel
             for reply in replies:
-                await channel.send(reply)
+                sent = await channel.send(reply)
+            # add reactions to the last message of the reply
+            await add_status_reactions(sent, report)
         elif channel_name in REVIEW_CHANNELS:
             # add reactions in review channel
-            await add_status_reactions(message, reply)
+            await add_status_reactions(message, report)
 
             # and send reply to
             for ch in REVIEW_REPLY_CHANNELS:
@@ -0,0 +1,230 @@
+from dotenv import load_dotenv
+from concurrent.futures import Future
+from contextlib import closing
+import json, os, sqlite3, threading, time, traceback
+
+# load environment variables
+load_dotenv()
+
+# script location
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
+# sqlite database to store cached IMDb/TMDb data,
+# relative paths are relative to the vdator directory (default: cache/metadata.sqlite)
+METADATA_CACHE_PATH = os.path.join(
+    __location__,
+    os.environ.get("METADATA_CACHE_PATH", "cache/metadata.sqlite").strip(),
+)
+# seconds before cached data is refreshed (default: 604800, 7 days)
+METADATA_CACHE_TTL = float(os.environ.get("METADATA_CACHE_TTL", "604800").strip())
+# seconds to remember invalid ids (default: 86400, 1 day)
+METADATA_CACHE_NEGATIVE_TTL = float(
+    os.environ.get("METADATA_CACHE_NEGATIVE_TTL", "86400").strip()
+)
+# seconds expired data is still used while it's refreshed in the background (default: 2592000, 30 days)
+METADATA_CACHE_STALE_TTL = float(
+    os.environ.get("METADATA_CACHE_STALE_TTL", "2592000").strip()
+)
+
+
+class MetadataNotFound(Exception):
+    """
+    Nothing exists for the key, for example an invalid id
+    """
+
+    pass
+
+
+class MetadataCache(object):
+    """
+    Persistent cache for data from external services, like IMDb and TMDb
+    """
+
+    def __init__(
+        self,
+        path=METADATA_CACHE_PATH,
+        ttl=METADATA_CACHE_TTL,
+        negative_ttl=METADATA_CACHE_NEGATIVE_TTL,
+        stale_ttl=METADATA_CACHE_STALE_TTL,
+    ):
+        """
+        Parameters
+        ----------
+        path : str
+            sqlite database file
+
+        ttl : float
+            seconds before cached data is refreshed
+
+        negative_ttl : float
+            seconds to remember keys that were not found
+
+        stale_ttl : float
+            seconds expired data is still used while it's refreshed in the background
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        # keys being refreshed in the background
+        self.refreshing = set()
+        # keys being fetched -> Future of the json data
+        self.fetching = dict()
+        self.lock = threading.Lock()
+        self._create_table()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _create_table(self):
+        cache_dir = os.path.dirname(self.path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, data TEXT, fetched REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+
+    def get(self, namespace, key):
+        """
+        Get a cache entry
+
+        Parameters
+        ----------
+        namespace : str
+            kind of data, for example 'imdb'
+
+        key : str
+            key within the namespace, for example an id
+
+        Returns
+        -------
+        (data, time fetched) tuple, data is None if the key was not found.
+        None if not cached.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT data, fetched FROM metadata WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return None
+        data, fetched = row
+        return (None if data is None else json.loads(data)), fetched
+
+    def set(self, namespace, key, data):
+        """
+        Store a cache entry
+
+        Parameters
+        ----------
+        namespace : str
+            kind of data, for example 'imdb'
+
+        key : str
+            key within the namespace, for example an id
+
+        data : object
+            json serializable data, None if the key was not found
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (namespace, key, data, fetched) VALUES (?, ?, ?, ?)",
+                (
+                    namespace,
+                    key,
+                    None if data is None else json.dumps(data),
+                    time.time(),
+                ),
+            )
+
+    def lookup(self, namespace, key, fetch):
+        """
+        Get data from the cache, or fetch and cache it.
+        Expired data is returned while it's refreshed in the background.
+
+        Parameters
+        ----------
+        namespace : str
+            kind of data, for example 'imdb'
+
+        key : str
+            key within the namespace, for example an id
+
+        fetch : function
+            gets the data, raises MetadataNotFound if the key doesn't exist.
+            Other exceptions are not cached.
+
+        Returns
+        -------
+        data
+
+        Raises
+        ------
+        MetadataNotFound if the key doesn't exist
+        """
+        entry = self.get(namespace, key)
+        if entry is not None:
+            data, fetched = entry
+            age = time.time() - fetched
+            if data is None:
+                if age < self.negative_ttl:
+                    raise MetadataNotFound(key)
+            elif age < self.ttl:
+                return data
+            elif age < self.ttl + self.stale_ttl:
+                self._refresh_in_background(namespace, key, fetch)
+                return data
+
+        return self._fetch(namespace, key, fetch)
+
+    def _fetch(self, namespace, key, fetch):
+        """
+        Fetch and cache data.
+        If the key is already being fetched, wait for that instead.
+        """
+        with self.lock:
+            future = self.fetching.get((namespace, key))
+            fetching = future is None
+            if fetching:
+                future = Future()
+                self.fetching[(namespace, key)] = future
+
+        if fetching:
+            try:
+                try:
+                    data = fetch()
+                except MetadataNotFound:
+                    self.set(namespace, key, None)
+                    raise
+                self.set(namespace, key, data)
+                future.set_result(json.dumps(data))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self.lock:
+                    del self.fetching[(namespace, key)]
+
+        # every caller gets its own copy of the data
+        return json.loads(future.result())
+
+    def _refresh_in_background(self, namespace, key, fetch):
+        with self.lock:
+            if (namespace, key) in self.refreshing:
+                return
+            self.refreshing.add((namespace, key))
+
+        def refresh():
+            try:
+                self._fetch(namespace, key, fetch)
+            except MetadataNotFound:
+                pass
+            except:
+                traceback.print_exc()
+            finally:
+                with self.lock:
+                    self.refreshing.discard((namespace, key))
+
+        threading.Thread(target=refresh, daemon=True).start()
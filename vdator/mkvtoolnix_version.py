@@ -0,0 +1,70 @@
+from dotenv import load_dotenv
+import os, requests
+
+from metadata_cache import MetadataCache
+
+# load environment variables
+load_dotenv()
+
+# mkvtoolnix NEWS.md url or local file, the first line has the latest version
+MKVTOOLNIX_NEWS = os.environ.get("MKVTOOLNIX_NEWS").strip()
+# minutes between checks for a new mkvtoolnix version (default: 60)
+MKVTOOLNIX_REFRESH_MINUTES = float(
+    os.environ.get("MKVTOOLNIX_REFRESH_MINUTES", "60").strip()
+)
+
+
+class MKVToolNixVersion(object):
+    """
+    Get the latest mkvtoolnix version.
+    Checks for a new version at most every MKVTOOLNIX_REFRESH_MINUTES in the background,
+    and remembers the last known version on disk.
+    """
+
+    def __init__(
+        self, news=MKVTOOLNIX_NEWS, refresh_minutes=MKVTOOLNIX_REFRESH_MINUTES
+    ):
+        """
+        Parameters
+        ----------
+        news : str
+            mkvtoolnix NEWS.md url or local file
+
+        refresh_minutes : float
+            minutes between checks for a new version
+        """
+        self.news = news
+        # keep the last known version forever, to work offline
+        self.cache = MetadataCache(ttl=refresh_minutes * 60, stale_ttl=float("inf"))
+
+    def get(self):
+        """
+        Get the latest mkvtoolnix version line
+
+        Returns
+        -------
+        str version line, for example: ## Version 76.0 "Celebration" 2023-04-30
+        """
+        return self.cache.lookup("mkvtoolnix", self.news, self._fetch)
+
+    def _fetch(self):
+        """
+        Read the first line of NEWS.md
+
+        Returns
+        -------
+        str version line
+        """
+        if self.news.startswith("file://") or os.path.isfile(self.news):
+            path = (
+                self.news[len("file://") :]
+                if self.news.startswith("file://")
+                else self.news
+            )
+            with open(path) as f:
+                return f.readline().rstrip("\r\n")
+
+        # only download the first line
+        with requests.get(self.news, stream=True, timeout=30) as r:
+            r.raise_for_status()
+            return next(r.iter_lines(decode_unicode=True))
@@ -1,18 +1,79 @@
-import nltk
-from nltk.corpus import stopwords
+from dotenv import load_dotenv
+from functools import lru_cache
+import os, threading
+
+# load environment variables
+load_dotenv()
+
+# max number of audio track names to remember the person names of (default: 4096)
+NAMES_CACHE_SIZE = int(os.environ.get("NAMES_CACHE_SIZE", "4096").strip())
+
+# named entity chunker used by nltk.ne_chunk
+NE_CHUNKER = "chunkers/maxent_ne_chunker/english_ace_multiclass.pickle"
+
+# nltk data, resource name -> path
+NLTK_DATA = {
+    "stopwords": "corpora/stopwords",
+    "punkt": "tokenizers/punkt",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "maxent_ne_chunker": "chunkers/maxent_ne_chunker",
+    "words": "corpora/words",
+}
+
+# nltk module, imported on first use
+_nltk = None
+_nltk_lock = threading.Lock()
+
+# nltk models, loaded once per process
+_stopwords = None
+_tagger = None
+_chunker = None
+_models_lock = threading.Lock()
+
+
+def get_nltk():
+    """
+    Get the nltk module, import it on first use
+
+    Returns
+    -------
+    nltk module
+    """
+    global _nltk
+    with _nltk_lock:
+        if _nltk is None:
+            import nltk
+
+            _nltk = nltk
+        return _nltk
 
 
 def download_nltk_data():
-    # download nltk data
-    ntlk_list = [
-        "stopwords",
-        "punkt",
-        "averaged_perceptron_tagger",
-        "maxent_ne_chunker",
-        "words",
-    ]
-    for t in ntlk_list:
-        nltk.download(t)
+    """
+    Download nltk data that is missing
+    """
+    nltk = get_nltk()
+    for name, path in NLTK_DATA.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(name)
+
+
+def load_models():
+    """
+    Load the stopwords, part of speech tagger and named entity chunker,
+    only the first time this is called.
+    Downloads missing nltk data first.
+    """
+    global _stopwords, _tagger, _chunker
+    with _models_lock:
+        if _chunker is None:
+            nltk = get_nltk()
+            download_nltk_data()
+            _stopwords = frozenset(nltk.corpus.stopwords.words("english"))
+            _tagger = nltk.tag.PerceptronTagger()
+            _chunker = nltk.data.load(NE_CHUNKER)
 
 
 def ie_preprocess(document):
@@ -28,17 +89,31 @@ def ie_preprocess(document):
     -------
     list sentences
     """
-    stop = stopwords.words("english")
-    document = " ".join([i for i in document.split() if i not in stop])
+    nltk = get_nltk()
+    load_models()
+    document = " ".join([i for i in document.split() if i not in _stopwords])
     sentences = nltk.sent_tokenize(document)
     sentences = [nltk.word_tokenize(sent) for sent in sentences]
-    sentences = [nltk.pos_tag(sent) for sent in sentences]
+    sentences = [_tagger.tag(sent) for sent in sentences]
     return sentences
 
 
+@lru_cache(maxsize=NAMES_CACHE_SIZE)
+def _extract_names(document):
+    nltk = get_nltk()
+    names = []
+    sentences = ie_preprocess(document)
+    for tagged_sentence in sentences:
+        for chunk in _chunker.parse(tagged_sentence):
+            if type(chunk) == nltk.tree.Tree:
+                if chunk.label() == "PERSON":
+                    names.append(" ".join([c[0] for c in chunk]))
+    return tuple(names)
+
+
 def extract_names(document):
     """
-    nltk extract person names
+    nltk extract person names, results are remembered
 
     Parameters
     ----------
@@ -49,11 +124,21 @@ def extract_names(document):
     -------
     list person names
     """
-    names = []
-    sentences = ie_preprocess(document)
-    for tagged_sentence in sentences:
-        for chunk in nltk.ne_chunk(tagged_sentence):
-            if type(chunk) == nltk.tree.Tree:
-                if chunk.label() == "PERSON":
-                    names.append(" ".join([c[0] for c in chunk]))
-    return names
+    return list(_extract_names(document))
+
+
+def word_tokenize(text):
+    """
+    nltk split text into words
+
+    Parameters
+    ----------
+    text : str
+        text
+
+    Returns
+    -------
+    list words
+    """
+    load_models()
+    return get_nltk().word_tokenize(text)
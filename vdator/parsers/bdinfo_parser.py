@@ -1,5 +1,7 @@
 import re
 
+from .tracks import BDInfoAudioTrack, BDInfoSubtitleTrack
+
 
 class BDInfoParser(object):
     """
@@ -108,14 +110,14 @@ class BDInfoParser(object):
 
         Parameters
         ----------
-        audio_track : dict
+        audio_track : BDInfoAudioTrack
             audio track
-            dict{'name':'...', 'language':'...'}
+            {'name':'...', 'language':'...'}
 
         Returns
         -------
-        audio track, compatibility track
-        [dict{'name':'...', 'language':'...'}, dict{'name':'...', 'language':'...'}]
+        BDInfoAudioTrack audio track with its compatibility track
+        {'name':'...', 'language':'...', 'compat_track':{'name':'...', 'language':'...'}}
         """
         audio_track_name_lower = audio_track["name"].lower()
         for i, track_type in enumerate(self.embedded_track_types):
@@ -128,16 +130,18 @@ class BDInfoParser(object):
             audio_track["name"],
             flags=re.IGNORECASE,
         )
-        audio_track["name"] = self.format_track_name(audio_parts[0])
-
-        compat_track = {
-            "name": self.format_track_name(
+        compat_track = BDInfoAudioTrack(
+            self.format_track_name(
                 "Compatibility Track / Dolby Digital Audio / "
                 + audio_parts[1].strip().rstrip(")")
             ),
-            "language": audio_track["language"],
-        }
-        return audio_track, compat_track
+            audio_track["language"],
+        )
+        return BDInfoAudioTrack(
+            self.format_track_name(audio_parts[0]),
+            audio_track["language"],
+            compat_track,
+        )
 
     def format_audio_track(self, name):
         """
@@ -150,15 +154,15 @@ class BDInfoParser(object):
 
         Returns
         -------
-        dict{'name':'...', 'language':'...'}
+        BDInfoAudioTrack{'name':'...', 'language':'...'}
         """
-        track = {"name": None, "language": None}
         name = name.strip()
         if " / " in name:
             name_parts = name.split(" / ", 1)
-            track["name"] = self.format_audio_track_name(name_parts[1])
-            track["language"] = name_parts[0]
-        return track
+            return BDInfoAudioTrack(
+                self.format_audio_track_name(name_parts[1]), name_parts[0]
+            )
+        return BDInfoAudioTrack(None, None)
 
     def format_subtitle_track(self, name):
         """
@@ -171,15 +175,13 @@ class BDInfoParser(object):
 
         Returns
         -------
-        dict{'language':'...', 'bitrate':'...'}
+        BDInfoSubtitleTrack{'language':'...', 'bitrate':'...'}
         """
-        track = {"language": None, "bitrate": None}
         name = name.strip()
         if " / " in name:
             name_parts = name.split(" / ", 1)
-            track["language"] = name_parts[0].strip()
-            track["bitrate"] = name_parts[1].strip()
-        return track
+            return BDInfoSubtitleTrack(name_parts[0].strip(), name_parts[1].strip())
+        return BDInfoSubtitleTrack(None, None)
 
     def playlist_report_format_video_track_name(self, name):
         """
@@ -218,9 +220,8 @@ class BDInfoParser(object):
 
         Returns
         -------
-        dict{'name':'...', 'language':'...'}
+        BDInfoAudioTrack{'name':'...', 'language':'...'}
         """
-        track = {"name": None, "language": None, "compat_track": None}
         try:
             name = name.strip()
             name_parts = name.split(" / ")
@@ -232,9 +233,7 @@ class BDInfoParser(object):
                 + " / "
                 + " / ".join(name_parts[1:]).strip()
             )
-            track["name"] = self.format_audio_track_name(name)
-            track["language"] = name_parts0[3]
-            return track
+            return BDInfoAudioTrack(self.format_audio_track_name(name), name_parts0[3])
         except ValueError:
             return False
 
@@ -268,11 +267,7 @@ class BDInfoParser(object):
         elif l2.startswith("audio:"):
             audio_track = self.format_audio_track(track_name)
             if self.has_compat_track(audio_track["name"]):
-                (
-                    audio_track,
-                    compat_track,
-                ) = self.format_audio_compatibility_track(audio_track)
-                audio_track["compat_track"] = compat_track
+                audio_track = self.format_audio_compatibility_track(audio_track)
             bdinfo["audio"].append(audio_track)
         elif l2.startswith("subtitle:"):
             bdinfo["subtitle"].append(self.format_subtitle_track(track_name))
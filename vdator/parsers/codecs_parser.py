@@ -25,18 +25,46 @@ class CodecsParser(object):
             "video": {...},
             "audio": {...}
           },
+          "track_title_eac3to": {...},
           "scan_types": {...}
         }
         """
         self.codecs = codecs
 
+        # codec names by type
+        self.video_codecs = frozenset(codecs["codecs"]["video"])
+        self.video_3d_codecs = frozenset(codecs["codecs"]["video_3d"])
+        self.audio_codecs = frozenset(codecs["codecs"]["audio"])
+        self.sub_codecs = frozenset(codecs["codecs"]["subtitles"])
+        self.chapter_codecs = frozenset(codecs["codecs"]["chapters"])
+
         # map of all codec names to extensions
         self.codec_ext = {
-            **self.codecs["codecs"]["video"],
-            **self.codecs["codecs"]["audio"],
-            **self.codecs["codecs"]["subtitles"],
-            **self.codecs["codecs"]["chapters"],
+            **codecs["codecs"]["video"],
+            **codecs["codecs"]["audio"],
+            **codecs["codecs"]["subtitles"],
+            **codecs["codecs"]["chapters"],
+        }
+
+        # track title codecs to title names, and their track type
+        self.video_title_names = dict(codecs["track_titles"]["video"])
+        self.audio_title_names = dict(codecs["track_titles"]["audio"])
+        self.title_types = {
+            **dict.fromkeys(self.video_title_names, "video"),
+            **dict.fromkeys(self.audio_title_names, "audio"),
         }
+        # title names back to track title codecs and the extension of their eac3to codec,
+        # DTS-HD.MA -> (DTS-HD Master Audio, .dtsma)
+        self.title_name_codecs = {
+            name: (
+                codec,
+                self.codec_ext.get(codecs["track_title_eac3to"].get(codec), ""),
+            )
+            for title_names in [self.video_title_names, self.audio_title_names]
+            for codec, name in title_names.items()
+        }
+
+        self.scan_types = dict(codecs["scan_types"])
 
     def is_video(self, codec):
         """
@@ -51,9 +79,7 @@ class CodecsParser(object):
         -------
         True if codec is a video codec, False otherwise.
         """
-        if codec in self.codecs["codecs"]["video"]:
-            return True
-        return False
+        return codec in self.video_codecs
 
     def is_video_title(self, codec):
         """
@@ -68,9 +94,7 @@ class CodecsParser(object):
         -------
         True if codec is a video title codec, False otherwise.
         """
-        if codec in self.codecs["track_titles"]["video"]:
-            return True
-        return False
+        return codec in self.video_title_names
 
     def is_video_3d(self, codec):
         """
@@ -85,9 +109,7 @@ class CodecsParser(object):
         -------
         True if codec is a 3d video, False otherwise.
         """
-        if codec in self.codecs["codecs"]["video_3d"]:
-            return True
-        return False
+        return codec in self.video_3d_codecs
 
     def is_audio(self, codec):
         """
@@ -102,9 +124,7 @@ class CodecsParser(object):
         -------
         True if codec is an audio codec, False otherwise.
         """
-        if codec in self.codecs["codecs"]["audio"]:
-            return True
-        return False
+        return codec in self.audio_codecs
 
     def is_audio_title(self, codec):
         """
@@ -119,9 +139,7 @@ class CodecsParser(object):
         -------
         True if codec is an audio title codec, False otherwise.
         """
-        if codec in self.codecs["track_titles"]["audio"]:
-            return True
-        return False
+        return codec in self.audio_title_names
 
     def is_sub(self, codec):
         """
@@ -136,9 +154,7 @@ class CodecsParser(object):
         -------
         True if codec is a subtitle codec, False otherwise.
         """
-        if codec in self.codecs["codecs"]["subtitles"]:
-            return True
-        return False
+        return codec in self.sub_codecs
 
     def is_chapter(self, codec):
         """
@@ -153,9 +169,7 @@ class CodecsParser(object):
         -------
         True if codec is a chapter codec, False otherwise.
         """
-        if codec in self.codecs["codecs"]["chapters"]:
-            return True
-        return False
+        return codec in self.chapter_codecs
 
     def is_codec(self, codec):
         """
@@ -185,9 +199,7 @@ class CodecsParser(object):
         -------
         str codec extension
         """
-        if codec not in self.codec_ext:
-            return ""
-        return self.codec_ext[codec]
+        return self.codec_ext.get(codec, "")
 
     def get_video_codec_title_name(self, codec):
         """
@@ -202,9 +214,7 @@ class CodecsParser(object):
         -------
         str codec title name
         """
-        if codec not in self.codecs["track_titles"]["video"]:
-            return ""
-        return self.codecs["track_titles"]["video"][codec]
+        return self.video_title_names.get(codec, "")
 
     def get_audio_codec_title_name(self, codec):
         """
@@ -219,9 +229,39 @@ class CodecsParser(object):
         -------
         str codec title name
         """
-        if codec not in self.codecs["track_titles"]["audio"]:
-            return ""
-        return self.codecs["track_titles"]["audio"][codec]
+        return self.audio_title_names.get(codec, "")
+
+    def get_title_name_codec(self, name):
+        """
+        Get track title codec and extension of a title name,
+        DTS-HD.MA -> (DTS-HD Master Audio, .dtsma)
+
+        Parameters
+        ----------
+        name : str
+          codec title name
+
+        Returns
+        -------
+        (str track title codec, str extension), empty strings if unknown
+        """
+        return self.title_name_codecs.get(name, ("", ""))
+
+    def classify_title(self, title):
+        """
+        Get the track type of every part of a track title
+
+        Parameters
+        ----------
+        title : str
+          track title, parts separated by ' / '
+
+        Returns
+        -------
+        list of (part, type) tuples, type is 'video', 'audio', or None if not a codec
+        """
+        title_types = self.title_types
+        return [(part, title_types.get(part)) for part in title.split(" / ")]
 
     def get_scan_type_title_name(self, scan_type, video_fps):
         """
@@ -250,6 +290,6 @@ class CodecsParser(object):
         if scan_type == "interlaced" and int(video_fps) == 25:
             actually_progressive = True
 
-        if scan_type not in self.codecs["scan_types"]:
+        if scan_type not in self.scan_types:
             return "", actually_progressive
-        return self.codecs["scan_types"][scan_type], actually_progressive
+        return self.scan_types[scan_type], actually_progressive
@@ -1,4 +1,4 @@
-import copy
+from collections import defaultdict, deque
 
 
 class MatchBDInfoAudioToMediaInfo(object):
@@ -7,57 +7,56 @@ class MatchBDInfoAudioToMediaInfo(object):
         self.bdinfo = bdinfo
         self.mediainfo = mediainfo
 
+    def _codec_channels(self, title):
+        """
+        Get the codec and channels of an audio track title
+
+        Parameters
+        ----------
+        title : str
+            audio track title
+
+        Returns
+        -------
+        (codec, channels) tuple, or None if the title doesn't have both
+        """
+        if not title:
+            return None
+        title, _, _ = self.remove_until_first_codec.remove(title)
+        if not title:
+            return None
+        parts = title.split(" / ")
+        if len(parts) <= 1:
+            return None
+        return parts[0], parts[1]
+
     def match_bdinfo_audio_to_mediainfo(self):
         # tries to match bdinfo audio tracks to mediainfo by codec and channels
         # for every mediainfo track, pick first matching bdinfo track
         # returns a sorted list of bdinfo audio tracks
+        bdinfo_audio_tracks = self.bdinfo["audio"]
         sorted_bdinfo_audio_tracks = list()
 
-        bdinfo_audio_tracks = copy.deepcopy(self.bdinfo["audio"])
-        mediainfo_audio_tracks = copy.deepcopy(self.mediainfo["audio"])
+        # (codec, channels) -> indexes of unmatched bdinfo tracks, in order
+        bdinfo_index = defaultdict(deque)
+        for i, bdinfo_audio_track in enumerate(bdinfo_audio_tracks):
+            key = self._codec_channels(bdinfo_audio_track.get("name"))
+            if key:
+                bdinfo_index[key].append(i)
 
-        for mediainfo_audio_track in mediainfo_audio_tracks:
+        matched = [False] * len(bdinfo_audio_tracks)
+        for mediainfo_audio_track in self.mediainfo["audio"]:
             # go through every mediainfo audio track
-            mediainfo_audio_title, mediainfo_audio_track_parts = None, []
-
-            if "title" in mediainfo_audio_track:
-                (
-                    mediainfo_audio_title,
-                    _,
-                    _,
-                ) = self.remove_until_first_codec.remove(mediainfo_audio_track["title"])
-                if mediainfo_audio_title:
-                    mediainfo_audio_track_parts = mediainfo_audio_title.split(" / ")
-
-            # find the next matching bdinfo audio track
-            for i, bdinfo_audio_track in enumerate(bdinfo_audio_tracks):
-                bdinfo_audio_title = None
-                if "name" in bdinfo_audio_track:
-                    (
-                        bdinfo_audio_title,
-                        _,
-                        _,
-                    ) = self.remove_until_first_codec.remove(bdinfo_audio_track["name"])
-
-                if len(mediainfo_audio_track_parts) > 1 and bdinfo_audio_title:
-                    bdinfo_audio_track_parts = bdinfo_audio_title.split(" / ")
-                    if len(bdinfo_audio_track_parts) > 1:
-                        if (
-                            bdinfo_audio_track_parts[0]
-                            == mediainfo_audio_track_parts[0]
-                            and bdinfo_audio_track_parts[1]
-                            == mediainfo_audio_track_parts[1]
-                        ):
-                            # codecs and channel match
-                            sorted_bdinfo_audio_tracks.append(bdinfo_audio_track)
-                            del bdinfo_audio_tracks[i]
-                            break
-
-            if len(bdinfo_audio_tracks) == 0:
-                break
-
-        if len(bdinfo_audio_tracks) > 0:
-            # add leftover bdinfo audio tracks
-            sorted_bdinfo_audio_tracks.extend(bdinfo_audio_tracks)
+            key = self._codec_channels(mediainfo_audio_track.get("title"))
+            if key in bdinfo_index and bdinfo_index[key]:
+                # codecs and channel match, take the next matching bdinfo audio track
+                i = bdinfo_index[key].popleft()
+                sorted_bdinfo_audio_tracks.append(bdinfo_audio_tracks[i])
+                matched[i] = True
+
+        # add leftover bdinfo audio tracks
+        sorted_bdinfo_audio_tracks.extend(
+            track for i, track in enumerate(bdinfo_audio_tracks) if not matched[i]
+        )
 
         return sorted_bdinfo_audio_tracks
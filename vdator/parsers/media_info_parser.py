@@ -1,6 +1,57 @@
+from iso639 import languages as iso639_languages
+from functools import lru_cache
+import json, re, sys
+import xml.etree.ElementTree as ET
+
+from .tracks import MEDIAINFO_TRACKS, Chapter, ChapterTitle
+
+# json/xml field -> text key, for fields that have a different name in text output
+STRUCTURED_KEYS = {
+    "Movie": "movie_name",
+    "Encoded_Application": "writing_application",
+    "Encoded_Library": "writing_library",
+    "Format_Commercial_IfAny": "commercial_name",
+    "colour_primaries": "color_primaries",
+    "colour_range": "color_range",
+}
+
+# language code -> name, where mediainfo's name is different from ISO 639
+LANGUAGE_NAMES = {"el": "Greek"}
+
+# start of the json track list
+JSON_TRACKS = re.compile(r'"track"\s*:\s*\[')
+# whitespace and commas between json tracks
+JSON_TRACK_SEPARATORS = " \t\r\n,"
+
+# duration units, in ms
+DURATION_UNITS = [("h", 3600000), ("min", 60000), ("s", 1000), ("ms", 1)]
+
+# characters to replace or remove when formatting keys
+KEY_TRANSLATOR = str.maketrans(
+    {" ": "_", "/": "_", "*": "_", "(": None, ")": None, ",": None}
+)
+
+
+@lru_cache(maxsize=1024)
+def format_key(key):
+    """
+    Format keys into abc_def_ghi, results are remembered
+
+    Parameters
+    ----------
+    key : str
+        mediainfo key
+
+    Returns
+    -------
+    str formatted mediainfo key, interned
+    """
+    return sys.intern(key.strip().translate(KEY_TRANSLATOR).lower())
+
+
 class MediaInfoParser(object):
     """
-    Parse MediaInfo
+    Parse MediaInfo text, JSON (--Output=JSON) or XML (--Output=XML)
     """
 
     def parse(self, text):
@@ -16,6 +67,12 @@ class MediaInfoParser(object):
         -------
         dict mediainfo with 'general', 'video', 'audio', 'text', and 'menu' keys
         """
+        first_line = next((l.strip() for l in text if l.strip()), "")
+        if first_line.startswith("{"):
+            return self.parse_json(text)
+        if first_line.startswith("<"):
+            return self.parse_xml(text)
+
         mediainfo_sections = ["general", "video", "audio", "text", "menu"]
         # dictionary of lists for mediainfo data
         mediainfo = dict((k, list()) for k in mediainfo_sections)
@@ -47,13 +104,17 @@ class MediaInfoParser(object):
             if curr_sect in ["general", "video", "audio", "text"] and len(curr) >= 2:
                 # assign section to dictionary
                 mediainfo[curr_sect][section_index[curr_sect]][
-                    self.format_key(curr[0])
+                    format_key(curr[0])
                 ] = curr[1]
             elif curr_sect == "menu":
                 mediainfo["menu"][section_index[curr_sect]].append(
                     self.parse_chapter(curr)
                 )
 
+        # tracks are immutable once all fields are read
+        for section, track_record in MEDIAINFO_TRACKS.items():
+            mediainfo[section] = [track_record(track) for track in mediainfo[section]]
+
         return mediainfo
 
     def format_key(self, key):
@@ -69,16 +130,7 @@ class MediaInfoParser(object):
         -------
         str formatted mediainfo key
         """
-        return (
-            key.strip()
-            .replace(" ", "_")
-            .replace("/", "_")
-            .replace("(", "")
-            .replace(")", "")
-            .replace("*", "_")
-            .replace(",", "")
-            .lower()
-        )
+        return format_key(key)
 
     def parse_chapter(self, curr):
         """
@@ -91,37 +143,28 @@ class MediaInfoParser(object):
 
         Returns
         -------
-        dict chapter
-        {"time": "...", "titles": [...], "languages": [...]}
-        languages list has unique elements
+        Chapter chapter
+        {"time": "...", "titles": (...), "languages": (...)}
+        languages are unique, in order
         """
-        chapter = {"time": None, "titles": list(), "languages": set()}
+        time, titles = None, list()
         if len(curr) >= 1:
-            chapter["time"] = curr[0].strip()
+            time = curr[0].strip()
         if len(curr) >= 2:
-            chapter_title = {
-                "language": None,
-                "title": None,
-            }
             if " - " in curr[1]:
                 langs = curr[1].split(" - ")
                 for lang in langs:
                     if ":" in lang:
                         # chapter has a language
-                        ch = self.format_chapter(lang)
-                        chapter["titles"].append(ch)
-                        chapter["languages"].add(ch["language"])
+                        titles.append(self.format_chapter(lang))
             elif ":" in curr[1]:
                 # chapter has a language
-                ch = self.format_chapter(curr[1])
-                chapter["titles"].append(ch)
-                chapter["languages"].add(ch["language"])
+                titles.append(self.format_chapter(curr[1]))
             else:
                 # no language, just store title
-                chapter_title["title"] = curr[1]
-                chapter["titles"].append(chapter_title)
-        chapter["languages"] = list(chapter["languages"])
-        return chapter
+                return Chapter(time, [ChapterTitle(None, curr[1])], [])
+        languages = dict.fromkeys(title.language for title in titles)
+        return Chapter(time, titles, languages)
 
     def format_chapter(self, text):
         """
@@ -134,8 +177,320 @@ class MediaInfoParser(object):
 
         Returns
         -------
-        dict chapter with 'language', 'title' keys
+        ChapterTitle chapter with 'language', 'title' keys
         """
         l = text.split(":", 1)
-        chapter = {"language": l[0].strip(), "title": l[1]}
-        return chapter
+        return ChapterTitle(l[0].strip(), l[1])
+
+    def parse_json(self, text):
+        """
+        Parse mediainfo JSON output
+
+        Parameters
+        ----------
+        text : list
+            list of mediainfo JSON lines
+
+        Returns
+        -------
+        dict mediainfo with 'general', 'video', 'audio', 'text', and 'menu' keys
+        """
+        return self._parse_tracks(*self._read_json_tracks(text))
+
+    def _read_json_tracks(self, text):
+        """
+        Read mediainfo JSON tracks line by line,
+        every track is decoded as soon as its last line is read
+
+        Parameters
+        ----------
+        text : list
+            list of mediainfo JSON lines
+
+        Returns
+        -------
+        list of dict tracks, str complete name or None
+        """
+        decoder = json.JSONDecoder()
+        tracks, complete_name = list(), None
+        buffer, in_tracks = "", False
+        for l in text:
+            buffer += l + "\n"
+            if not in_tracks:
+                tracks_start = JSON_TRACKS.search(buffer)
+                if not tracks_start:
+                    continue
+                # file name is the media's @ref, before the tracks
+                ref = re.search(r'"@ref"\s*:\s*("(?:[^"\\]|\\.)*")', buffer)
+                if ref:
+                    complete_name = json.loads(ref.group(1))
+                buffer, in_tracks = buffer[tracks_start.end() :], True
+
+            # decode finished tracks
+            buffer = buffer.lstrip(JSON_TRACK_SEPARATORS)
+            while buffer.startswith("{") and "}" in l:
+                try:
+                    track, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    # track continues on the next lines
+                    break
+                tracks.append(track)
+                buffer = buffer[end:].lstrip(JSON_TRACK_SEPARATORS)
+            if buffer.startswith("]"):
+                break
+        else:
+            if in_tracks:
+                # the track list didn't end
+                raise ValueError("Unfinished mediainfo JSON track list")
+            # no tracks, the json should still be valid
+            json.loads(buffer)
+        return tracks, complete_name
+
+    def parse_xml(self, text):
+        """
+        Parse mediainfo XML output
+
+        Parameters
+        ----------
+        text : list
+            list of mediainfo XML lines
+
+        Returns
+        -------
+        dict mediainfo with 'general', 'video', 'audio', 'text', and 'menu' keys
+        """
+        tracks, complete_name = list(), None
+        parser = ET.XMLPullParser(events=("start", "end"))
+        for l in text:
+            parser.feed(l + "\n")
+            for event, element in parser.read_events():
+                # ignore namespace
+                tag = element.tag.rsplit("}", 1)[-1]
+                if event == "start":
+                    if tag == "media":
+                        # file name is the media's ref
+                        complete_name = element.get("ref")
+                    continue
+                if tag != "track":
+                    continue
+                track = {"@type": element.get("type")}
+                for field in element:
+                    name = field.tag.rsplit("}", 1)[-1]
+                    if name == "extra":
+                        track["extra"] = dict(
+                            (e.tag.rsplit("}", 1)[-1], e.text or "") for e in field
+                        )
+                    else:
+                        track[name] = field.text or ""
+                tracks.append(track)
+                element.clear()
+        parser.close()
+        return self._parse_tracks(tracks, complete_name)
+
+    def _parse_tracks(self, tracks, complete_name=None):
+        """
+        Map mediainfo JSON/XML tracks to the same structure as the text output
+
+        Parameters
+        ----------
+        tracks : list
+            list of dict tracks with '@type' and mediainfo fields
+
+        complete_name : str
+            file name from the media's ref, or None
+
+        Returns
+        -------
+        dict mediainfo with 'general', 'video', 'audio', 'text', and 'menu' keys
+        """
+        mediainfo_sections = ["general", "video", "audio", "text", "menu"]
+        mediainfo = dict((k, list()) for k in mediainfo_sections)
+
+        for track in tracks:
+            section = (track.get("@type") or "").lower()
+            if section not in mediainfo_sections:
+                continue
+
+            extra = track.get("extra") or dict()
+            if section == "menu":
+                # chapters are extra fields named like _00_00_00_000
+                chapters = list()
+                for name, value in extra.items():
+                    time = re.match(r"^_(\d+)_(\d+)_(\d+)_(\d+)$", name)
+                    if time:
+                        chapters.append(
+                            self.parse_chapter(
+                                ["{}:{}:{}.{}".format(*time.groups()), value]
+                            )
+                        )
+                mediainfo["menu"].append(chapters)
+                continue
+
+            fields = dict()
+            for name, value in track.items():
+                if name.startswith("@") or name == "extra" or name in STRUCTURED_KEYS:
+                    continue
+                if isinstance(value, str):
+                    fields[self._structured_key(name)] = self._structured_value(
+                        name, value, track
+                    )
+            for name, key in STRUCTURED_KEYS.items():
+                if isinstance(track.get(name), str):
+                    fields[key] = track[name]
+            if section == "general" and complete_name:
+                fields["complete_name"] = complete_name
+            # custom tags, like IMDB and TMDB
+            for name, value in extra.items():
+                if isinstance(value, str):
+                    fields[format_key(name)] = value
+            mediainfo[section].append(MEDIAINFO_TRACKS[section](fields))
+
+        return mediainfo
+
+    def _structured_key(self, name):
+        """
+        Format a JSON/XML field name like a text key, FrameRate -> frame_rate
+
+        Parameters
+        ----------
+        name : str
+            JSON/XML field name
+
+        Returns
+        -------
+        str formatted mediainfo key
+        """
+        return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower().replace("__", "_")
+
+    def _structured_value(self, name, value, track):
+        """
+        Format a JSON/XML field value like the text output
+
+        Parameters
+        ----------
+        name : str
+            JSON/XML field name
+
+        value : str
+            JSON/XML field value
+
+        track : dict
+            JSON/XML track, for fields that are combined in the text output
+
+        Returns
+        -------
+        str formatted value
+        """
+        try:
+            if name == "Language":
+                return self._language_name(value)
+            if name in ["Width", "Height"]:
+                return self._thousands(int(value)) + " pixels"
+            if name == "BitRate":
+                bit_rate = float(value)
+                if bit_rate >= 10000000:
+                    # 3 significant digits, like 30.0 Mb/s or 113 Mb/s
+                    mbps = bit_rate / 1000000
+                    return ("{:.0f}" if mbps >= 100 else "{:.1f}").format(
+                        mbps
+                    ) + " Mb/s"
+                return self._thousands(round(bit_rate / 1000)) + " kb/s"
+            if name == "Format" and track.get("Format_AdditionalFeatures"):
+                # DTS and XLL -> DTS XLL
+                return value + " " + track["Format_AdditionalFeatures"]
+            if name == "FrameRate":
+                frame_rate = "{:.3f}".format(float(value))
+                num, den = track.get("FrameRate_Num"), track.get("FrameRate_Den")
+                if num and den and den != "1":
+                    # 23.976 (24000/1001) FPS
+                    frame_rate += " (" + num + "/" + den + ")"
+                frame_rate += " FPS"
+                if track.get("SamplesPerFrame"):
+                    # audio, 93.750 FPS (512 SPF)
+                    frame_rate += " (" + track["SamplesPerFrame"] + " SPF)"
+                return frame_rate
+            if name == "Duration":
+                return self._duration(float(value))
+            if name == "SamplingRate":
+                return "{:.1f}".format(int(value) / 1000) + " kHz"
+            if name == "BitDepth":
+                return value + " bits"
+            if name == "Channels":
+                return value + (" channel" if value == "1" else " channels")
+            if name == "Format_Version" and value.isdigit():
+                return "Version " + value
+            if name == "DisplayAspectRatio":
+                ratio = float(value)
+                for aspect_ratio, text in [(4 / 3, "4:3"), (16 / 9, "16:9")]:
+                    if abs(ratio - aspect_ratio) < 0.01:
+                        return text
+                return "{:.2f}".format(ratio) + ":1"
+        except ValueError:
+            pass
+        return value
+
+    def _duration(self, seconds):
+        """
+        Format a duration like the text output, with the two largest units,
+        like 1 h 52 min or 45 s 120 ms
+
+        Parameters
+        ----------
+        seconds : float
+            duration in seconds
+
+        Returns
+        -------
+        str formatted duration
+        """
+        ms = int(round(seconds * 1000))
+        for i, (unit, unit_ms) in enumerate(DURATION_UNITS):
+            if ms >= unit_ms or unit == "ms":
+                duration = str(ms // unit_ms) + " " + unit
+                if i + 1 < len(DURATION_UNITS):
+                    next_unit, next_unit_ms = DURATION_UNITS[i + 1]
+                    duration += (
+                        " " + str(ms % unit_ms // next_unit_ms) + " " + next_unit
+                    )
+                return duration
+
+    def _thousands(self, num):
+        """
+        Format a number with spaces between thousands, like 1 080
+
+        Parameters
+        ----------
+        num : int
+            number
+
+        Returns
+        -------
+        str formatted number
+        """
+        return "{:,}".format(num).replace(",", " ")
+
+    def _language_name(self, code):
+        """
+        Get the language name of a language code, like en -> English
+
+        Parameters
+        ----------
+        code : str
+            language code, optionally with a region like en-US
+
+        Returns
+        -------
+        str language name, or the code if unknown
+        """
+        lang, _, region = code.partition("-")
+        name = LANGUAGE_NAMES.get(lang)
+        if not name:
+            for part in ["part1", "part2b", "part2t", "part3"]:
+                try:
+                    name = iso639_languages.get(**{part: lang}).name
+                    break
+                except KeyError:
+                    continue
+        if not name:
+            return code
+        return name + (" (" + region + ")" if region else "")
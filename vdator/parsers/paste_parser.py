@@ -1,6 +1,6 @@
 from dotenv import load_dotenv
 from enum import Enum
-import os
+import os, re
 
 # load environment variables
 load_dotenv()
@@ -12,6 +12,34 @@ IGNORE_UNTIL_BLANK_LINE_PREFIXES = [
     x.strip()
     for x in os.getenv("IGNORE_UNTIL_BLANK_LINE_PREFIXES", "").strip().split(",")
 ]
+# prefixes for str.startswith(), empty if not set
+IGNORE_PREFIXES = (
+    tuple(IGNORE_UNTIL_BLANK_LINE_PREFIXES)
+    if IGNORE_UNTIL_BLANK_LINE_PREFIXES[0] != ""
+    else tuple()
+)
+
+
+def is_ignore_after_line(l):
+    """
+    Check if we should ignore all input after the current line
+
+    Parameters
+    ----------
+    l : str
+        current line
+
+    Returns
+    -------
+    True if should ignore further input, False otherwise
+    """
+    if IGNORE_AFTER_LINE_METHOD == "equals":
+        if IGNORE_AFTER_LINE == l:
+            return True
+    elif IGNORE_AFTER_LINE_METHOD == "contains":
+        if IGNORE_AFTER_LINE in l:
+            return True
+    return False
 
 
 class BDInfoType(Enum):
@@ -38,14 +66,93 @@ class PasteParser(object):
         PLAYLIST_INNER_VIDEO = 1
         PLAYLIST_INNER_AUDIO = 2
 
+    # lines that start a section, matched against the lowercase line
+    # group number -> section
+    SECTION_START = re.compile(
+        r"(quick summary|disc title|disc label)|(playlist report)|(eac3to v)|(general)"
+    )
+    SECTION_START_GROUPS = {
+        1: Section.QUICK_SUMMARY,
+        2: Section.PLAYLIST_REPORT,
+        3: Section.EAC3TO_LOG,
+        4: Section.MEDIAINFO,
+    }
+
+    # lines that may start a mediainfo --Output=JSON or --Output=XML block,
+    # matched against the lowercase line
+    BLOCK_START = re.compile(r"(\{)|(<\?xml|<mediainfo)")
+    # group number -> block type
+    BLOCK_START_GROUPS = {1: "json", 2: "xml"}
+    # first characters of lines that may start a block
+    BLOCK_START_CHARS = frozenset("{<")
+    # mediainfo json keys and xml root, a block is only mediainfo once one is found
+    BLOCK_CONFIRM = {
+        "json": re.compile(r'"(?:media|track)"\s*:'),
+        "xml": re.compile(r"<mediainfo\b"),
+    }
+    # max number of lines to look for a mediainfo json key or xml root
+    BLOCK_CONFIRM_LINES = 10
+
+    # json strings, removed before counting braces
+    JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+    # lines that start a playlist report section, matched against the lowercase line
+    PLAYLIST_SECTION_START = re.compile(r"(video:)|(audio:)|(subtitles:)|(-----)")
+    PLAYLIST_SECTION_START_GROUPS = {
+        1: Section2.PLAYLIST_VIDEO,
+        2: Section2.PLAYLIST_AUDIO,
+        3: Section2.PLAYLIST_SUBTITLES,
+    }
+
+    def split_files(self, text):
+        """
+        Split text with multiple mediainfo into one group of lines per file,
+        with the file's bdinfo, mediainfo and eac3to log.
+        A new file starts at a bdinfo, eac3to log or mediainfo after a mediainfo,
+        lines after the last mediainfo without a mediainfo of their own stay in the last file.
+
+        Parameters
+        ----------
+        text : str or iterable
+            text to split, or its lines
+
+        Returns
+        -------
+        list of lists of lines
+        """
+        files = [list()]
+        has_mediainfo = False
+
+        for l, block_line in self._read_lines(text):
+            sect = self._section_start(l.strip().lower(), block_line)
+            if sect:
+                if has_mediainfo and sect in (
+                    self.Section.QUICK_SUMMARY,
+                    self.Section.PLAYLIST_REPORT,
+                    self.Section.EAC3TO_LOG,
+                    self.Section.MEDIAINFO,
+                ):
+                    files.append(list())
+                    has_mediainfo = False
+                if sect == self.Section.MEDIAINFO:
+                    has_mediainfo = True
+
+            files[-1].append(l)
+
+        if len(files) > 1 and not has_mediainfo:
+            # only the last file can be missing a mediainfo, keep its lines with the file before it
+            files[-2].extend(files.pop())
+
+        return files
+
     def parse(self, text):
         """
         Parse text to extract bdinfo, mediainfo and eac3to log
 
         Parameters
         ----------
-        text : str
-            text to parse
+        text : str or iterable
+            text to parse, or its lines
 
         Returns
         -------
@@ -60,76 +167,73 @@ class PasteParser(object):
         sect2 = None
         sect3 = None
 
-        # parse bdinfo
-        lines = text.splitlines()
-        ignore_next_lines, did_first_mediainfo = False, False
-        for l in lines:
-            # break after ignore line
-            if self._isIgnoreAfterLine(l):
-                break
+        # enum attribute access is slow, look up sections once
+        QUICK_SUMMARY = self.Section.QUICK_SUMMARY
+        PLAYLIST_REPORT = self.Section.PLAYLIST_REPORT
+        EAC3TO_LOG = self.Section.EAC3TO_LOG
+        MEDIAINFO = self.Section.MEDIAINFO
+        PLAYLIST_VIDEO = self.Section2.PLAYLIST_VIDEO
+        PLAYLIST_AUDIO = self.Section2.PLAYLIST_AUDIO
+        PLAYLIST_INNER_VIDEO = self.Section3.PLAYLIST_INNER_VIDEO
+        PLAYLIST_INNER_AUDIO = self.Section3.PLAYLIST_INNER_AUDIO
 
-            if not l.strip():
-                # don't ignore input after blank line
-                ignore_next_lines = False
+        # parse bdinfo
+        did_first_mediainfo = False
+        # lines up to the ignore line, without ignored lines
+        for l, block_line in self._read_lines(text):
+            # normalize line once
+            l = l.strip()
+            if not l:
                 # skip blank lines
                 continue
 
-            if ignore_next_lines:
-                continue
-
-            if (
-                IGNORE_UNTIL_BLANK_LINE_PREFIXES
-                and IGNORE_UNTIL_BLANK_LINE_PREFIXES[0] != ""
-            ):
-                l3 = l.strip().lower()
-                for x in IGNORE_UNTIL_BLANK_LINE_PREFIXES:
-                    if l3.startswith(x):
-                        ignore_next_lines = True
-                        break
-
-            l = l.strip()
-            l2 = l.strip().lower()
+            l2 = l.lower()
 
             # determine current section
             # limit to first mediainfo
-            if (
-                l2.startswith("quick summary")
-                or l2.startswith("disc title")
-                or l2.startswith("disc label")
-            ):
-                sect = self.Section.QUICK_SUMMARY
-                bdinfo["type"] = BDInfoType.QUICK_SUMMARY
-            elif l2.startswith("playlist report"):
-                sect = self.Section.PLAYLIST_REPORT
-                bdinfo["type"] = BDInfoType.PLAYLIST_REPORT
-            elif l2.startswith("eac3to v"):
-                sect = self.Section.EAC3TO_LOG
-                eac3to.append(list())
-                eac3to_index += 1
-            elif l2.startswith("general"):
-                if did_first_mediainfo:
+            if block_line is None:
+                block_ended = False
+                section_start = self.SECTION_START.match(l2)
+                new_sect = (
+                    self.SECTION_START_GROUPS[section_start.lastindex]
+                    if section_start
+                    else None
+                )
+            else:
+                block_ended = block_line[1]
+                new_sect = self._section_start(l2, block_line)
+            if new_sect:
+                if new_sect == QUICK_SUMMARY:
+                    sect = new_sect
+                    bdinfo["type"] = BDInfoType.QUICK_SUMMARY
+                elif new_sect == PLAYLIST_REPORT:
+                    sect = new_sect
+                    bdinfo["type"] = BDInfoType.PLAYLIST_REPORT
+                elif new_sect == EAC3TO_LOG:
+                    sect = new_sect
+                    eac3to.append(list())
+                    eac3to_index += 1
+                elif did_first_mediainfo:
                     sect = None
                 else:
-                    sect = self.Section.MEDIAINFO
+                    sect = new_sect
                     did_first_mediainfo = True
 
-            if sect == self.Section.QUICK_SUMMARY:
+            if sect == QUICK_SUMMARY:
                 # parse quick summary into bdinfo dict
                 self.bdinfo_parser.parse_quick_summary_line(bdinfo, l)
-            elif sect == self.Section.PLAYLIST_REPORT:
-
-                if l2.startswith("video:"):
-                    sect2 = self.Section2.PLAYLIST_VIDEO
-                elif l2.startswith("audio:"):
-                    sect2 = self.Section2.PLAYLIST_AUDIO
-                elif l2.startswith("subtitles:"):
-                    sect2 = self.Section2.PLAYLIST_SUBTITLES
-
-                if l2.startswith("-----"):
-                    if sect2 == self.Section2.PLAYLIST_VIDEO:
-                        sect3 = self.Section3.PLAYLIST_INNER_VIDEO
-                    elif sect2 == self.Section2.PLAYLIST_AUDIO:
-                        sect3 = self.Section3.PLAYLIST_INNER_AUDIO
+            elif sect == PLAYLIST_REPORT:
+                playlist_section_start = self.PLAYLIST_SECTION_START.match(l2)
+                if playlist_section_start and playlist_section_start.lastindex < 4:
+                    sect2 = self.PLAYLIST_SECTION_START_GROUPS[
+                        playlist_section_start.lastindex
+                    ]
+
+                if playlist_section_start and playlist_section_start.lastindex == 4:
+                    if sect2 == PLAYLIST_VIDEO:
+                        sect3 = PLAYLIST_INNER_VIDEO
+                    elif sect2 == PLAYLIST_AUDIO:
+                        sect3 = PLAYLIST_INNER_AUDIO
                 else:
                     # skip tracks that start with minus sign
                     if l.startswith("-"):
@@ -137,10 +241,7 @@ class PasteParser(object):
                     # parse hidden tracks
                     l = l.lstrip("* ")
 
-                    if (
-                        sect2 == self.Section2.PLAYLIST_VIDEO
-                        and sect3 == self.Section3.PLAYLIST_INNER_VIDEO
-                    ):
+                    if sect2 == PLAYLIST_VIDEO and sect3 == PLAYLIST_INNER_VIDEO:
                         # format video track name with slashes
                         track_name = (
                             self.bdinfo_parser.playlist_report_format_video_track_name(
@@ -150,27 +251,25 @@ class PasteParser(object):
                         if track_name:
                             bdinfo["video"].append(track_name)
 
-                    elif (
-                        sect2 == self.Section2.PLAYLIST_AUDIO
-                        and sect3 == self.Section3.PLAYLIST_INNER_AUDIO
-                    ):
+                    elif sect2 == PLAYLIST_AUDIO and sect3 == PLAYLIST_INNER_AUDIO:
                         audio_track = (
                             self.bdinfo_parser.playlist_report_format_audio_track(l)
                         )
                         if self.bdinfo_parser.has_compat_track(l):
-                            (
-                                audio_track,
-                                compat_track,
-                            ) = self.bdinfo_parser.format_audio_compatibility_track(
-                                audio_track
+                            audio_track = (
+                                self.bdinfo_parser.format_audio_compatibility_track(
+                                    audio_track
+                                )
                             )
-                            audio_track["compat_track"] = compat_track
                         bdinfo["audio"].append(audio_track)
 
-            elif sect == self.Section.MEDIAINFO:
+            elif sect == MEDIAINFO:
                 mediainfo.append(l)
+                # mediainfo json/xml ends with its block
+                if block_ended:
+                    sect = None
 
-            elif sect == self.Section.EAC3TO_LOG:
+            elif sect == EAC3TO_LOG:
                 if l.startswith("Done."):
                     sect = None
                 else:
@@ -178,23 +277,126 @@ class PasteParser(object):
 
         return bdinfo, mediainfo, eac3to
 
-    def _isIgnoreAfterLine(self, l):
+    def _read_lines(self, text):
+        """
+        Read lines up to the ignore line, and find mediainfo json/xml blocks.
+        Lines after a line starting with one of IGNORE_UNTIL_BLANK_LINE_PREFIXES
+        are skipped until a blank line.
+        A block that starts like json or xml is only mediainfo if a mediainfo json key
+        or xml root is in its first BLOCK_CONFIRM_LINES lines,
+        otherwise its lines are read as normal lines.
+
+        Parameters
+        ----------
+        text : str or iterable
+            text to read, or its lines
+
+        Yields
+        ------
+        (line, block_line) tuples, block_line is None for lines outside of a mediainfo block,
+        or (first, last) booleans for lines in a mediainfo json/xml block
+        """
+        lines = text.splitlines() if isinstance(text, str) else text
+        # possible mediainfo block and its lines until it's confirmed
+        block, depth, confirmed, first, buffered = None, 0, False, True, list()
+        block_start_match = self.BLOCK_START.match
+        ignore_next_lines = False
+        for l in lines:
+            if is_ignore_after_line(l):
+                break
+
+            if IGNORE_PREFIXES:
+                l2 = l.strip()
+                if not l2:
+                    # don't ignore input after blank line
+                    ignore_next_lines = False
+                elif ignore_next_lines:
+                    continue
+                elif l2.lower().startswith(IGNORE_PREFIXES):
+                    ignore_next_lines = True
+
+            if not block:
+                # most lines can't start a block
+                if l.lstrip()[:1] not in self.BLOCK_START_CHARS:
+                    yield l, None
+                    continue
+                block_start = block_start_match(l.strip().lower())
+                if not block_start:
+                    yield l, None
+                    continue
+                block = self.BLOCK_START_GROUPS[block_start.lastindex]
+                depth, confirmed, first, buffered = 0, False, True, list()
+
+            l2 = l.strip().lower()
+            block_type = block
+            block, depth = self._update_block(block, depth, l2)
+            if not confirmed and self.BLOCK_CONFIRM[block_type].search(l2):
+                confirmed = True
+                for b in buffered:
+                    yield b, (first, False)
+                    first = False
+                buffered = list()
+
+            if confirmed:
+                yield l, (first, block is None)
+                first = False
+            else:
+                buffered.append(l)
+                if not block or len(buffered) >= self.BLOCK_CONFIRM_LINES:
+                    # not mediainfo, read as normal lines
+                    for b in buffered:
+                        yield b, None
+                    block, buffered = None, list()
+
+        # block at the end of the text that isn't mediainfo
+        for b in buffered:
+            yield b, None
+
+    def _section_start(self, l2, block_line):
         """
-        Check if we should ignore all input after the current line
+        Get the section a line starts
 
         Parameters
         ----------
-        l : str
-            current line
+        l2 : str
+            current stripped lowercase line
+
+        block_line : tuple
+            (first, last) booleans if the line is in a mediainfo json/xml block, None otherwise
+
+        Returns
+        -------
+        Section the line starts, or None
+        """
+        if block_line:
+            # lines in a mediainfo json/xml block don't start sections
+            return self.Section.MEDIAINFO if block_line[0] else None
+        section_start = self.SECTION_START.match(l2)
+        if section_start:
+            return self.SECTION_START_GROUPS[section_start.lastindex]
+        return None
+
+    def _update_block(self, block, depth, l2):
+        """
+        Track the end of a mediainfo json/xml block
+
+        Parameters
+        ----------
+        block : str
+            'json' or 'xml'
+
+        depth : int
+            json object depth before the current line
+
+        l2 : str
+            current lowercase line
 
         Returns
         -------
-        True if should ignore further input, False otherwise
+        block type, or None if the block ended on the current line, and json object depth
         """
-        if IGNORE_AFTER_LINE_METHOD == "equals":
-            if IGNORE_AFTER_LINE == l:
-                return True
-        elif IGNORE_AFTER_LINE_METHOD == "contains":
-            if IGNORE_AFTER_LINE in l:
-                return True
-        return False
+        if block == "json":
+            l2 = self.JSON_STRING.sub("", l2)
+            depth += l2.count("{") - l2.count("}")
+            return ("json" if depth > 0 else None), depth
+        return (None if "</mediainfo>" in l2 else "xml"), depth
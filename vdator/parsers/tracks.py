@@ -0,0 +1,280 @@
+from collections.abc import Mapping
+import re
+
+INTEGER = re.compile(r"\d+")
+DECIMAL = re.compile(r"\d+\.\d+")
+NUMBER = re.compile(r"\d*\.\d+|\d+")
+BIT_RATE = re.compile(r"([\d ]*\d(?:\.\d+)?)\s*([km])b/s")
+
+
+def _integer(value):
+    # all digits, 1 080 pixels -> 1080
+    digits = "".join(INTEGER.findall(value))
+    return int(digits) if digits else None
+
+
+def _decimal(value, regex=NUMBER):
+    # first number, 23.976 (24000/1001) FPS -> 23.976
+    m = regex.search(value)
+    return float(m.group()) if m else None
+
+
+def _bit_rate_kbps(value):
+    # 1 509 kb/s -> 1509, 30.0 Mb/s -> 30000
+    m = BIT_RATE.search(value.lower())
+    if not m:
+        return None
+    kbps = float(m.group(1).replace(" ", ""))
+    if m.group(2) == "m":
+        kbps *= 1000
+    return int(round(kbps))
+
+
+class Record(Mapping):
+    """
+    Immutable track record, with a read-only dict view of its fields
+    for checks that use track["field"] and "field" in track.
+
+    Records can't be changed, so copies are the same record.
+    """
+
+    __slots__ = ()
+    # record fields, in constructor order
+    FIELDS = ()
+    # fields left out of the dict view when they are None
+    OPTIONAL = ()
+
+    def __init__(self, *args):
+        for name, value in zip(self.FIELDS, args):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(type(self).__name__ + " is immutable")
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not None or key not in self.OPTIONAL:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        for name in self.FIELDS:
+            if name not in self.OPTIONAL or getattr(self, name) is not None:
+                yield name
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + repr(dict(self)) + ")"
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, name) for name in self.FIELDS))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class BDInfoAudioTrack(Record):
+    """
+    BDInfo audio track
+
+    Attributes
+    ----------
+    name : str
+        track name
+
+    language : str
+        track language
+
+    compat_track : BDInfoAudioTrack
+        embedded compatibility track, or None
+    """
+
+    FIELDS = ("name", "language", "compat_track")
+    __slots__ = FIELDS
+    OPTIONAL = ("compat_track",)
+
+    def __init__(self, name, language, compat_track=None):
+        super().__init__(name, language, compat_track)
+
+
+class BDInfoSubtitleTrack(Record):
+    """
+    BDInfo subtitle track
+
+    Attributes
+    ----------
+    language : str
+        track language
+
+    bitrate : str
+        track bitrate
+    """
+
+    FIELDS = ("language", "bitrate")
+    __slots__ = FIELDS
+
+    def __init__(self, language, bitrate):
+        super().__init__(language, bitrate)
+
+
+class ChapterTitle(Record):
+    """
+    Chapter title in one language
+
+    Attributes
+    ----------
+    language : str
+        chapter language, or None
+
+    title : str
+        chapter title
+    """
+
+    FIELDS = ("language", "title")
+    __slots__ = FIELDS
+
+    def __init__(self, language, title):
+        super().__init__(language, title)
+
+
+class Chapter(Record):
+    """
+    Mediainfo chapter
+
+    Attributes
+    ----------
+    time : str
+        chapter time
+
+    titles : tuple
+        tuple of ChapterTitle
+
+    languages : tuple
+        unique chapter languages
+    """
+
+    FIELDS = ("time", "titles", "languages")
+    __slots__ = FIELDS
+
+    def __init__(self, time, titles, languages):
+        super().__init__(time, tuple(titles), tuple(languages))
+
+
+class MediaInfoTrack(Record):
+    """
+    Mediainfo track, with numeric fields parsed once
+
+    The dict view has the track's mediainfo fields.
+    Numeric attributes are None when the field is missing or has no number.
+
+    Attributes
+    ----------
+    height : int
+        height in pixels
+
+    fps : float
+        frame rate
+
+    channels : float
+        number of audio channels
+
+    bit_rate_kbps : int
+        bit rate in kb/s
+
+    sampling_rate_khz : float
+        sampling rate in kHz
+
+    bit_depth : int
+        bit depth in bits
+    """
+
+    FIELDS = (
+        "_fields",
+        "height",
+        "fps",
+        "channels",
+        "bit_rate_kbps",
+        "sampling_rate_khz",
+        "bit_depth",
+    )
+    __slots__ = FIELDS
+
+    def __init__(self, fields):
+        """
+        Parameters
+        ----------
+        fields : dict
+            mediainfo fields
+        """
+        get = fields.get
+        super().__init__(
+            dict(fields),
+            _integer(get("height", "")),
+            _decimal(get("frame_rate", ""), DECIMAL),
+            _decimal(get("channels", "")),
+            _bit_rate_kbps(get("bit_rate", "")),
+            _decimal(get("sampling_rate", "")),
+            _integer(get("bit_depth", "")),
+        )
+
+    def __getitem__(self, key):
+        return self._fields[key]
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def __reduce__(self):
+        return (type(self), (self._fields,))
+
+
+class GeneralTrack(MediaInfoTrack):
+    """
+    Mediainfo general section
+    """
+
+    __slots__ = ()
+
+
+class VideoTrack(MediaInfoTrack):
+    """
+    Mediainfo video track
+    """
+
+    __slots__ = ()
+
+
+class AudioTrack(MediaInfoTrack):
+    """
+    Mediainfo audio track
+    """
+
+    __slots__ = ()
+
+
+class TextTrack(MediaInfoTrack):
+    """
+    Mediainfo text track
+    """
+
+    __slots__ = ()
+
+
+# mediainfo section -> track record
+MEDIAINFO_TRACKS = {
+    "general": GeneralTrack,
+    "video": VideoTrack,
+    "audio": AudioTrack,
+    "text": TextTrack,
+}
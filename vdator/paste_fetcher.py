@@ -0,0 +1,122 @@
+from dotenv import load_dotenv
+import aiohttp, codecs, os
+
+from parsers.paste_parser import is_ignore_after_line
+
+# load environment variables
+load_dotenv()
+
+# seconds to wait for a paste to download (default: 30)
+PASTE_TIMEOUT = float(os.environ.get("PASTE_TIMEOUT", "30").strip())
+# seconds to wait for a connection to a pastebin site (default: 10)
+PASTE_CONNECT_TIMEOUT = float(os.environ.get("PASTE_CONNECT_TIMEOUT", "10").strip())
+# max number of open connections (default: 20)
+PASTE_MAX_CONNECTIONS = int(os.environ.get("PASTE_MAX_CONNECTIONS", "20").strip())
+# max number of open connections to a single pastebin site (default: 4)
+PASTE_MAX_CONNECTIONS_PER_HOST = int(
+    os.environ.get("PASTE_MAX_CONNECTIONS_PER_HOST", "4").strip()
+)
+# seconds to keep an idle connection to a pastebin site open (default: 30)
+PASTE_KEEPALIVE_TIMEOUT = float(os.environ.get("PASTE_KEEPALIVE_TIMEOUT", "30").strip())
+# max bytes of a paste to download, the rest is ignored (default: 10485760, 10 MB)
+PASTE_MAX_BYTES = int(os.environ.get("PASTE_MAX_BYTES", "10485760").strip())
+
+# bytes to read at a time
+PASTE_CHUNK_SIZE = 65536
+
+
+def split_lines(text):
+    """
+    Split text into complete lines and the incomplete rest
+
+    Parameters
+    ----------
+    text : str
+        text to split
+
+    Returns
+    -------
+    list of complete lines without line breaks, str rest of the text
+    """
+    parts = text.splitlines(True)
+    rest = ""
+    # last part is incomplete if it has no line break,
+    # or ends with \r that could be followed by \n
+    if parts and (parts[-1].endswith("\r") or parts[-1] == parts[-1].splitlines()[0]):
+        rest = parts.pop()
+    return [p.splitlines()[0] for p in parts], rest
+
+
+class PasteFetcher(object):
+    """
+    Download pastes with a shared async HTTP client
+    """
+
+    def __init__(self):
+        self.session = None
+
+    def _get_session(self):
+        """
+        Get the shared client session, create it on first use
+        so it is bound to the running event loop
+
+        Returns
+        -------
+        aiohttp.ClientSession
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=PASTE_MAX_CONNECTIONS,
+                limit_per_host=PASTE_MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=PASTE_KEEPALIVE_TIMEOUT,
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=PASTE_TIMEOUT, sock_connect=PASTE_CONNECT_TIMEOUT
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout, raise_for_status=True
+            )
+        return self.session
+
+    async def get_lines(self, url):
+        """
+        Download a paste line by line.
+        Stops at the ignore after line, or after PASTE_MAX_BYTES.
+
+        Parameters
+        ----------
+        url : str
+            url to raw paste
+
+        Returns
+        -------
+        list of str paste lines, bool True if the paste was cut off at PASTE_MAX_BYTES
+        """
+        session = self._get_session()
+        lines = list()
+        async with session.get(url) as r:
+            decoder = codecs.getincrementaldecoder(r.charset or "utf-8")(
+                errors="replace"
+            )
+            rest, size = "", 0
+            async for chunk in r.content.iter_chunked(PASTE_CHUNK_SIZE):
+                size += len(chunk)
+                too_big = size > PASTE_MAX_BYTES
+                if too_big:
+                    chunk = chunk[: len(chunk) - (size - PASTE_MAX_BYTES)]
+
+                new_lines, rest = split_lines(rest + decoder.decode(chunk))
+                for l in new_lines:
+                    if is_ignore_after_line(l):
+                        return lines, False
+                    lines.append(l)
+
+                if too_big:
+                    # ignore the cut off line
+                    return lines, True
+
+            for l in (rest + decoder.decode(b"", final=True)).splitlines():
+                if is_ignore_after_line(l):
+                    return lines, False
+                lines.append(l)
+        return lines, False
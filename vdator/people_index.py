@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+from dotenv import load_dotenv
+from contextlib import closing
+import argparse, gzip, os, sqlite3
+
+# load environment variables
+load_dotenv()
+
+# script location
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
+# sqlite database of person names, checked before searching TMDb/IMDb,
+# relative paths are relative to the vdator directory (default: none)
+PEOPLE_INDEX_PATH = os.environ.get("PEOPLE_INDEX_PATH", "").strip()
+if PEOPLE_INDEX_PATH:
+    PEOPLE_INDEX_PATH = os.path.join(__location__, PEOPLE_INDEX_PATH)
+
+
+def normalize_name(name):
+    """
+    Remove extra whitespace from a name
+
+    Parameters
+    ----------
+    name : str
+        person name
+
+    Returns
+    -------
+    str normalized name
+    """
+    return " ".join(name.split())
+
+
+class PeopleIndex(object):
+    """
+    Local index of person names, built from a dump of names.
+    The database is opened on each lookup, names are not found while it's missing.
+    """
+
+    def __init__(self, path=PEOPLE_INDEX_PATH):
+        """
+        Parameters
+        ----------
+        path : str
+            sqlite database file
+        """
+        self.path = path
+
+    def _connect(self):
+        return sqlite3.connect("file:" + self.path + "?mode=ro", uri=True)
+
+    def lookup(self, name):
+        """
+        Find a person by exact or case-folded name
+
+        Parameters
+        ----------
+        name : str
+            person name
+
+        Returns
+        -------
+        True if a person has this name,
+        False otherwise or if the index is missing or can't be read
+        """
+        if not os.path.isfile(self.path):
+            return False
+        name = normalize_name(name)
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT 1 FROM people WHERE name = ? OR name_folded = ? LIMIT 1",
+                    (name, name.casefold()),
+                ).fetchone()
+        except sqlite3.Error:
+            # search TMDb/IMDb instead
+            return False
+        return row is not None
+
+
+def read_names(path):
+    """
+    Read names from a text file with one name per line,
+    or an IMDb name.basics.tsv(.gz) dump
+
+    Parameters
+    ----------
+    path : str
+        names file
+
+    Returns
+    -------
+    generator of str names
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        column = None
+        for i, line in enumerate(f):
+            line = line.rstrip("\r\n")
+            if i == 0 and line.startswith("nconst\t"):
+                # IMDb dump header
+                column = line.split("\t").index("primaryName")
+                continue
+            name = line.split("\t")[column] if column is not None else line
+            name = normalize_name(name)
+            if name and name != "\\N":
+                yield name
+
+
+def build_index(names, path, batch_size=10000):
+    """
+    Build a people index
+
+    Parameters
+    ----------
+    names : iterable
+        person names
+
+    path : str
+        sqlite database file to create
+
+    batch_size : int
+        number of names to insert at a time
+
+    Returns
+    -------
+    int number of names in the index
+    """
+    index_dir = os.path.dirname(path)
+    if index_dir:
+        os.makedirs(index_dir, exist_ok=True)
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute("DROP TABLE IF EXISTS people")
+        conn.execute(
+            "CREATE TABLE people (name TEXT PRIMARY KEY, name_folded TEXT NOT NULL) WITHOUT ROWID"
+        )
+        batch = list()
+        for name in names:
+            batch.append((name, name.casefold()))
+            if len(batch) >= batch_size:
+                conn.executemany("INSERT OR IGNORE INTO people VALUES (?, ?)", batch)
+                batch = list()
+        conn.executemany("INSERT OR IGNORE INTO people VALUES (?, ?)", batch)
+        conn.execute("CREATE INDEX people_name_folded ON people (name_folded)")
+        return conn.execute("SELECT COUNT(*) FROM people").fetchone()[0]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build the people index from a dump of names"
+    )
+    parser.add_argument(
+        "names",
+        help="text file with one name per line, or IMDb name.basics.tsv(.gz)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=PEOPLE_INDEX_PATH,
+        required=not PEOPLE_INDEX_PATH,
+        help="sqlite database file to create (default: PEOPLE_INDEX_PATH)",
+    )
+    args = parser.parse_args()
+    count = build_index(read_names(args.names), args.output)
+    print("Indexed " + str(count) + " names in " + args.output)
@@ -0,0 +1,140 @@
+"""
+Render reply records as discord markdown, html, or json
+"""
+
+from discord_markdown.discord_markdown import (
+    Compiler,
+    convert_to_html as discord_markdown_convert_to_html,
+)
+
+from reporter import REPORT_EMOJIS
+
+
+# Override discord_markdown.discord_markdown.Compiler.compile method to disable printing
+# https://github.com/bitjockey42/discord-markdown/blob/9b8d267e3bf1b333bccaae5619a3f2af0a5a54a1/discord_markdown/compiler.py#L29-L37
+def compile(self, markdown=False):
+    if not self._parser.tree:
+        self._parser.parse()
+    self._code = ""
+    for node in self._parser.tree:
+        self._code = self._code + node.eval(markdown=markdown)
+    self._code = self._code.strip()
+    return self._code
+
+
+Compiler.compile = compile
+
+# report type -> prefix
+REPORT_PREFIXES = dict((k, v + " ") for k, v in REPORT_EMOJIS.items())
+
+# emoji -> html image
+HTML_EMOJIS = {
+    "☑": "<img src='http://discord.com//assets/86c16c39d96283551fd4ca7392e22681.svg' height='16'>",
+    "⚠": "<img src='https://discord.com/assets/289673858e06dfa2e0e3a7ee610c3a30.svg' height='16'>",
+    "❌": "<img src='https://discord.com/assets/8becd37ab9d13cdfe37c08c496a9def3.svg' height='16'>",
+}
+
+
+def report_prefix(type):
+    """
+    Get the prefix of a report
+
+    Parameters
+    ----------
+    type : str
+        report type: 'correct', 'warning', 'error', 'info', or 'fail'
+
+    Returns
+    -------
+    str emoji and a space, or [TYPE] for unknown types
+    """
+    if type in REPORT_PREFIXES:
+        return REPORT_PREFIXES[type]
+    return "[" + type.upper() + "] "
+
+
+def render_discord(records):
+    """
+    Render records as discord markdown
+
+    Parameters
+    ----------
+    records : list
+        list of ReportRecord
+
+    Returns
+    -------
+    str reply
+    """
+    # join the parts once instead of growing a string
+    parts = []
+    append = parts.append
+    for record in records:
+        type = record.type
+        if type == "text":
+            append(record.message)
+            continue
+        if type == "header":
+            append("> **")
+            append(record.message)
+            append("**")
+        else:
+            append(report_prefix(type))
+            append(record.message)
+        if record.new_line:
+            append("\n")
+        if record.hint:
+            append(record.hint)
+    return "".join(parts)
+
+
+def render_html(records):
+    """
+    Render records as html
+
+    Parameters
+    ----------
+    records : list
+        list of ReportRecord
+
+    Returns
+    -------
+    str html reply
+    """
+    # prevent infinite loop with 2 multi-line code blocks
+    # https://github.com/bitjockey42/discord-markdown/issues/6
+    reply_to_convert = render_discord(records).replace("```", "===")
+    # remove quotes around sections
+    reply_to_convert = reply_to_convert.replace("> **", "**")
+
+    # convert to html
+    reply_html = discord_markdown_convert_to_html(reply_to_convert)
+
+    # format html
+    reply_html = reply_html.replace("===", "<br>")
+    # emojis
+    for em, img in HTML_EMOJIS.items():
+        reply_html = reply_html.replace(em, img)
+    return reply_html
+
+
+def render_json(records, report):
+    """
+    Render records as json
+
+    Parameters
+    ----------
+    records : list
+        list of ReportRecord
+
+    report : dict
+        report results from Reporter.get_report()
+
+    Returns
+    -------
+    dict with 'records', list of record dicts, and 'report', the report results
+    """
+    return {
+        "records": [record.to_dict() for record in records],
+        "report": dict(report),
+    }
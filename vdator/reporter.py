@@ -1,9 +1,132 @@
-import re
+import threading
 
 # APIs
 import emoji
 from helpers import num_to_emoji
 
+# types of reports that are counted
+REPORT_TYPES = ["correct", "warning", "error", "info", "fail"]
+
+# emojis are resolved once, emojize looks up aliases on every call
+# report type -> emoji
+REPORT_EMOJIS = {
+    "correct": emoji.emojize(":ballot_box_with_check:", language="alias"),
+    "warning": emoji.emojize(":warning:", language="alias"),
+    "error": emoji.emojize(":x:", language="alias"),
+    "info": emoji.emojize(":information_source:", language="alias"),
+    "fail": emoji.emojize(":interrobang:", language="alias"),
+}
+# number of errors -> emoji, from 1 to 10
+NUM_EMOJIS = dict(
+    (n, emoji.emojize(num_to_emoji(n), language="alias")) for n in range(1, 11)
+)
+PLUS_EMOJI = emoji.emojize(":heavy_plus_sign:", language="alias")
+
+
+class ReportRecord(object):
+    """
+    A part of a reply
+    """
+
+    __slots__ = ("type", "message", "new_line", "hint", "track", "check", "section")
+
+    def __init__(self, type, message, new_line=True, hint=None, track=None):
+        """
+        Parameters
+        ----------
+        type : str
+            'correct', 'warning', 'error', 'info', or 'fail' for reports,
+            'header' for section headers, 'text' for other text
+
+        message : str
+            reply message
+
+        new_line : bool
+            print a new line after message
+
+        hint : str
+            hint shown after the message, or None
+
+        track : str
+            id of the track this is about, like #2, or None
+        """
+        self.type = type
+        self.message = message
+        self.new_line = new_line
+        self.hint = hint
+        self.track = track
+        # set by the checker, name of the check and section this is from
+        self.check = None
+        self.section = None
+
+    def to_dict(self):
+        """
+        Get the record as a dict
+
+        Returns
+        -------
+        dict with 'type', 'message', 'hint', 'track', 'check', and 'section' keys
+        """
+        return {
+            "type": self.type,
+            "message": self.message,
+            "hint": self.hint,
+            "track": self.track,
+            "check": self.check,
+            "section": self.section,
+        }
+
+
+class Records(list):
+    """
+    Records of a reply, in order.
+    Adding a str adds it as text.
+    """
+
+    def __iadd__(self, other):
+        if isinstance(other, str):
+            if not other:
+                return self
+            if self and self[-1].type == "text":
+                # join text, records can be shared so make a new one
+                self[-1] = ReportRecord(
+                    "text", self[-1].message + other, new_line=False
+                )
+            else:
+                self.append(ReportRecord("text", other, new_line=False))
+        elif isinstance(other, ReportRecord):
+            self.append(other)
+        else:
+            self.extend(other)
+        return self
+
+    def hint(self, hint):
+        """
+        Add a hint to the last record
+
+        Parameters
+        ----------
+        hint : str
+            hint, like the differences from helpers.show_diff
+        """
+        self[-1].hint = (self[-1].hint or "") + hint
+
+    def set_origin(self, check, section):
+        """
+        Set the check and section of the records
+
+        Parameters
+        ----------
+        check : str
+            check name
+
+        section : str
+            section header
+        """
+        for record in self:
+            record.check = check
+            record.section = section
+
 
 class Reporter(object):
     """
@@ -11,17 +134,31 @@ class Reporter(object):
     """
 
     def __init__(self):
+        # checks can report at the same time
+        self.lock = threading.Lock()
         self.setup()
 
+    def __getstate__(self):
+        # locks can't be sent to another process
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
     def setup(self):
         """
         Setup/Reset the reporter
         """
-        self.report = {"correct": 0, "warning": 0, "error": 0, "info": 0, "fail": 0}
+        self.report = dict((k, 0) for k in REPORT_TYPES)
+        # an online lookup failed, the results can change when it's tried again
+        self.lookup_failed = False
 
-    def print_report(self, type, message, record=True, new_line=True):
+    def print_report(self, type, message, record=True, new_line=True, track=None):
         """
-        Display report
+        Create a report
 
         Parameters
         ----------
@@ -37,24 +174,51 @@ class Reporter(object):
         new_line : bool
             print a new line after message
             default: True
+
+        track : str
+            id of the track this is about, like #2
+
+        Returns
+        -------
+        ReportRecord report
         """
         if record:
-            self.report[type.lower()] += 1
-
-        msg_type = {
-            "correct": emoji.emojize(":ballot_box_with_check:", language="alias"),
-            "warning": emoji.emojize(":warning:", language="alias"),
-            "error": emoji.emojize(":x:", language="alias"),
-            "info": emoji.emojize(":information_source:", language="alias"),
-            "fail": emoji.emojize(":interrobang:", language="alias"),
-        }
+            with self.lock:
+                self.report[type.lower()] += 1
 
-        if type.lower() in msg_type:
-            type = msg_type[type.lower()] + " "
-        else:
-            type = "[" + type.upper() + "] "
+        return ReportRecord(type.lower(), message, new_line=new_line, track=track)
+
+    def print_lookup_failure(self, message, track=None):
+        """
+        Create an info report for a failed online lookup, like TMDb, IMDb or mkvtoolnix
+
+        Parameters
+        ----------
+        message : str
+            reply message
 
-        return type + message + ("\n" if new_line else "")
+        track : str
+            id of the track this is about, like #2
+
+        Returns
+        -------
+        ReportRecord report
+        """
+        self.lookup_failed = True
+        return self.print_report("info", message, track=track)
+
+    def add_report(self, report):
+        """
+        Add report results to the totals, like the results of another file
+
+        Parameters
+        ----------
+        report : dict
+            report results from Reporter.get_report()
+        """
+        with self.lock:
+            for k, v in report.items():
+                self.report[k] += v
 
     def get_report(self):
         """
@@ -88,6 +252,19 @@ class Reporter(object):
         reply += ", and " + str(self.report["info"]) + " info"
         return reply
 
+    def summary(self):
+        """
+        Get the report section
+
+        Returns
+        -------
+        Records with the report header and results
+        """
+        records = Records()
+        records += ReportRecord("header", "Report")
+        records += self.display_report()
+        return records
+
 
 async def react_num_errors(message, num_errors):
     """
@@ -102,18 +279,16 @@ async def react_num_errors(message, num_errors):
     num_errors : int
         number of errors
     """
-    if num_errors in range(1, 11):
+    if num_errors in NUM_EMOJIS:
         # errors between 1 and 10
-        em = num_to_emoji(num_errors)
-        if em:
-            await message.add_reaction(emoji.emojize(em, language="alias"))
+        await message.add_reaction(NUM_EMOJIS[num_errors])
     elif num_errors > 10:
         # more than 10 errors
-        await message.add_reaction(emoji.emojize(num_to_emoji(10), language="alias"))
-        await message.add_reaction(emoji.emojize(":heavy_plus_sign:", language="alias"))
+        await message.add_reaction(NUM_EMOJIS[10])
+        await message.add_reaction(PLUS_EMOJI)
 
 
-async def add_status_reactions(message, content):
+async def add_status_reactions(message, report):
     """
     Add status reactions to discord message
 
@@ -122,39 +297,23 @@ async def add_status_reactions(message, content):
     message : discord.Message
         discord message to react to
 
-    content : str
-        content to parse to determine reactions
+    report : dict
+        report results from Reporter.get_report()
     """
-    # add status reactions to message based on content
-    report_re = re.search(
-        r"(\d+)\scorrect,\s(\d+)\swarnings?,\s(\d+)\serrors?,\s(\d+)\sfailures?,\sand\s(\d+)\sinfo",
-        content,
-    )
-    if report_re:
-        report = {
-            "correct": int(report_re.group(1)),
-            "warning": int(report_re.group(2)),
-            "error": int(report_re.group(3)),
-            "fail": int(report_re.group(4)),
-            "info": int(report_re.group(5)),
-        }
-
+    # add status reactions to message based on report results
+    if report:
         if report["warning"] == 0 and report["error"] == 0 and report["fail"] == 0:
-            await message.add_reaction(
-                emoji.emojize(":ballot_box_with_check:", language="alias")
-            )
+            await message.add_reaction(REPORT_EMOJIS["correct"])
         else:
             if report["warning"] > 0:
-                await message.add_reaction(emoji.emojize(":warning:", language="alias"))
+                await message.add_reaction(REPORT_EMOJIS["warning"])
             if report["error"] > 0:
-                await message.add_reaction(emoji.emojize(":x:", language="alias"))
+                await message.add_reaction(REPORT_EMOJIS["error"])
 
             num_errors = report["warning"] + report["error"]
             if num_errors > 0:
                 await react_num_errors(message, num_errors)
 
             if report["fail"] > 0:
-                await message.add_reaction(
-                    emoji.emojize(":interrobang:", language="alias")
-                )
+                await message.add_reaction(REPORT_EMOJIS["fail"])
                 await react_num_errors(message, report["fail"])
@@ -0,0 +1,197 @@
+from dotenv import load_dotenv
+from collections import OrderedDict
+import hashlib, os, threading, time
+
+# load environment variables
+load_dotenv()
+
+# max number of cached results (default: 128)
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", "128").strip())
+# seconds to keep a cached result (default: 600)
+RESULT_CACHE_TTL = float(os.environ.get("RESULT_CACHE_TTL", "600").strip())
+
+TRAINEE_CHANNELS = [x.strip() for x in os.environ.get("TRAINEE_CHANNELS").split(",")]
+INTERNAL_CHANNELS = [x.strip() for x in os.environ.get("INTERNAL_CHANNELS").split(",")]
+
+# settings that change the reply for the same paste
+CONFIG_ENV_VARS = [
+    "DVD_CHECK_MODE",
+    "FILENAME_CUTS",
+    "HUNSPELL_LANG",
+    "IGNORE_AFTER_LINE",
+    "IGNORE_AFTER_LINE_METHOD",
+    "IGNORE_UNTIL_BLANK_LINE_PREFIXES",
+    "INTERNAL_CHANNELS",
+    "MISSPELLED_IGNORE_LIST",
+    "MKVMERGE_VERSION",
+    "MKVTOOLNIX_NEWS",
+    "MOVIE_YEAR_OFFSET",
+    "RELEASE_GROUP",
+    "TRAINEE_CHANNELS",
+]
+
+# script location
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
+
+def config_version():
+    """
+    Hash of the settings and codec definitions that change the reply
+
+    Returns
+    -------
+    str config version
+    """
+    h = hashlib.sha256()
+    for name in CONFIG_ENV_VARS:
+        h.update((name + "=" + os.environ.get(name, "") + "\n").encode("utf-8"))
+    with open(os.path.join(__location__, "data/codecs.json"), "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+CONFIG_VERSION = config_version()
+
+
+def channel_class(channel_name):
+    """
+    Get the class of a channel, channels of the same class get the same reply
+
+    Parameters
+    ----------
+    channel_name : str
+        name of the channel
+
+    Returns
+    -------
+    str 'internal', 'trainee' or 'bot'
+    """
+    if channel_name in INTERNAL_CHANNELS:
+        return "internal"
+    if channel_name in TRAINEE_CHANNELS:
+        return "trainee"
+    return "bot"
+
+
+def normalize_paste(paste):
+    """
+    Normalize paste text, so the same paste from different pastebin sites
+    has the same text
+
+    Parameters
+    ----------
+    paste : str or list
+        paste text, or its lines
+
+    Returns
+    -------
+    str normalized paste text
+    """
+    lines = paste.splitlines() if isinstance(paste, str) else paste
+    # unify line endings and remove trailing spaces
+    return "\n".join([l.rstrip() for l in lines]).strip("\n")
+
+
+class ResultCache(object):
+    """
+    LRU cache of validation results with a time to live
+    """
+
+    def __init__(self, size=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL):
+        """
+        Parameters
+        ----------
+        size : int
+            max number of cached results
+
+        ttl : float
+            seconds to keep a cached result
+        """
+        self.size = size
+        self.ttl = ttl
+        # key -> (expires, result)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, paste, channel_name):
+        """
+        Get the cache key for a paste
+
+        Parameters
+        ----------
+        paste : str or list
+            paste text, or its lines
+
+        channel_name : str
+            name of the channel the paste was sent in
+
+        Returns
+        -------
+        str cache key
+        """
+        h = hashlib.sha256(normalize_paste(paste).encode("utf-8"))
+        h.update(("\n" + channel_class(channel_name)).encode("utf-8"))
+        h.update(("\n" + CONFIG_VERSION).encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key):
+        """
+        Get a cached result
+
+        Parameters
+        ----------
+        key : str
+            cache key
+
+        Returns
+        -------
+        cached result, None if not cached or expired
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, result):
+        """
+        Cache a result, evicting the least recently used results when full
+
+        Parameters
+        ----------
+        key : str
+            cache key
+
+        result : object
+            result to cache
+        """
+        if self.size <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def stats(self):
+        """
+        Get cache statistics
+
+        Returns
+        -------
+        dict{'hits': int, 'misses': int, 'size': int, 'max_size': int}
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.entries),
+                "max_size": self.size,
+            }
@@ -1,4 +1,4 @@
-import os, re
+import os
 
 # 'mediainfo' to use mediainfo fields
 # 'nobdinfo' to assume DVD if no bdinfo given
@@ -43,10 +43,8 @@ class SourceDetector(object):
                 and len(self.mediainfo["video"]) >= 1
                 and "height" in self.mediainfo["video"][0]
             ):
-                height = int(
-                    "".join(re.findall(r"[\d]+", self.mediainfo["video"][0]["height"]))
-                )
-                if height <= 576:
+                height = self.mediainfo["video"][0].height
+                if height is not None and height <= 576:
                     # height is 480p or 576p for dvds
                     # Note: checking standard is NTSC or PAL won't work, as some BDs are NTSC
                     is_dvd = True
@@ -110,10 +108,7 @@ class SourceDetector(object):
             and len(self.mediainfo["video"]) >= 1
             and "height" in self.mediainfo["video"][0]
         ):
-            height = int(
-                "".join(re.findall(r"[\d]+", self.mediainfo["video"][0]["height"]))
-            )
-            if height == 2160:
+            if self.mediainfo["video"][0].height == 2160:
                 is_uhd = True
 
         return is_uhd
@@ -0,0 +1,347 @@
+from dotenv import load_dotenv
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio, json, os, re, threading, traceback
+
+# parsers
+from parsers import *
+from source_detector import SourceDetector
+from reporter import Records, ReportRecord, Reporter
+from checker import Checker, warm_up
+from result_cache import ResultCache
+
+# load environment variables
+load_dotenv()
+
+# run validation jobs in a 'thread' or 'process' pool (default: thread)
+VALIDATION_POOL = os.environ.get("VALIDATION_POOL", "thread").strip()
+# max number of pastes validated at the same time (default: 4)
+VALIDATION_WORKERS = int(os.environ.get("VALIDATION_WORKERS", "4").strip())
+# validate every mediainfo in a paste, for example season packs (default: false)
+MULTI_FILE_MODE = os.environ.get("MULTI_FILE_MODE", "false").strip().lower() == "true"
+
+# script location
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
+# initialize parsers, they don't keep any state between pastes
+bdinfo_parser = BDInfoParser()
+paste_parser = PasteParser(bdinfo_parser)
+mediainfo_parser = MediaInfoParser()
+
+with open(os.path.join(__location__, "data/codecs.json")) as f:
+    codecs = json.load(f)
+    codecs_parser = CodecsParser(codecs)
+
+
+class ValidationJob(object):
+    """
+    Validate a single paste.
+    Every job gets its own checker, reporter and source detector,
+    so jobs can run at the same time.
+    """
+
+    def __init__(self, paste, channel_name):
+        """
+        Parameters
+        ----------
+        paste : str or list
+            paste text, or its lines
+
+        channel_name : str
+            name of the channel the paste was sent in
+        """
+        self.paste = paste
+        self.channel_name = channel_name
+
+    def run(self):
+        """
+        Parse and check the paste
+
+        Returns
+        -------
+        Records reply, Reporter with the results
+        """
+        reply = Records()
+        reporter = Reporter()
+        source_detector = SourceDetector()
+        checker = Checker(codecs_parser, source_detector, reporter)
+
+        try:
+            (bdinfo, mediainfo, eac3to) = paste_parser.parse(self.paste)
+        except:
+            traceback.print_exc()
+            reply += reporter.print_report("fail", "Paste parser failed")
+            return reply, reporter
+
+        if not mediainfo:
+            reply += reporter.print_report(
+                "error", "No mediainfo. Are you missing the `General` heading?"
+            )
+            return reply, reporter
+
+        try:
+            # parse mediainfo
+            mediainfo = mediainfo_parser.parse(mediainfo)
+        except:
+            traceback.print_exc()
+            reply += reporter.print_report("fail", "Mediainfo parser failed")
+            return reply, reporter
+
+        try:
+            # share the checker's remembered titles
+            match_bdinfo_audio_to_mediainfo = MatchBDInfoAudioToMediaInfo(
+                checker.remove_until_first_codec, bdinfo, mediainfo
+            )
+            bdinfo[
+                "audio"
+            ] = match_bdinfo_audio_to_mediainfo.match_bdinfo_audio_to_mediainfo()
+            bdinfo["audio"] = bdinfo_parser.expand_compat_tracks(bdinfo["audio"])
+        except:
+            traceback.print_exc()
+            reply += reporter.print_report(
+                "fail", "Matching bdinfo audio tracks to mediainfo"
+            )
+            return reply, reporter
+
+        try:
+            # setup checker
+            checker.setup(bdinfo, mediainfo, eac3to, self.channel_name)
+        except:
+            traceback.print_exc()
+            reply += reporter.print_report("fail", "vdator failed to setup checker")
+            return reply, reporter
+
+        try:
+            reply += checker.run_checks()
+        except:
+            traceback.print_exc()
+            reply += reporter.print_report("fail", "vdator failed to parse")
+
+        return reply, reporter
+
+
+def file_name(lines):
+    """
+    Get the file name from mediainfo lines
+
+    Parameters
+    ----------
+    lines : list
+        paste lines of a file
+
+    Returns
+    -------
+    str file name, None if not found
+    """
+    for l in lines:
+        complete_name = re.match(r"^\s*complete name\s*:\s*(.+?)\s*$", l, re.IGNORECASE)
+        if complete_name:
+            # remove path
+            return re.split(r"[\\/]", complete_name.group(1))[-1]
+    return None
+
+
+def combine_results(files, results):
+    """
+    Combine the results of validating each file of a paste
+
+    Parameters
+    ----------
+    files : list
+        paste lines of each file
+
+    results : list
+        (Records reply, Reporter) tuple of each file
+
+    Returns
+    -------
+    Records reply with a section per file, Reporter with the totals
+    """
+    reply = Records()
+    reporter = Reporter()
+    for i, (lines, (file_reply, file_reporter)) in enumerate(zip(files, results)):
+        name = file_name(lines)
+        reply += ReportRecord(
+            "header", "File " + str(i + 1) + "/" + str(len(files)), new_line=False
+        )
+        reply += (": `" + name + "`" if name else "") + "\n"
+        reply += file_reply
+        reporter.add_report(file_reporter.get_report())
+    return reply, reporter
+
+
+class ValidationPool(object):
+    """
+    Run validation jobs in a thread or process pool,
+    and cache the results of identical pastes
+    """
+
+    def __init__(
+        self, pool_type=VALIDATION_POOL, workers=VALIDATION_WORKERS, cache=None
+    ):
+        """
+        Parameters
+        ----------
+        pool_type : str
+            'thread' or 'process'
+
+        workers : int
+            max number of jobs to run at the same time
+
+        cache : ResultCache
+            cache for job results
+            default: new ResultCache
+        """
+        if pool_type == "process":
+            # every worker process loads the checker's dependencies when it starts
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=warm_up
+            )
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.cache = cache if cache is not None else ResultCache()
+
+    def warm_up(self):
+        """
+        Load the checker's dependencies in the background,
+        so the first paste doesn't wait for them
+
+        Returns
+        -------
+        concurrent.futures.Future
+        """
+        return self.executor.submit(warm_up)
+
+    def submit(self, job):
+        """
+        Run a validation job in the pool, or use the cached result
+        of the same paste.
+        The cache key hashes the whole paste, call this off the event loop.
+
+        Parameters
+        ----------
+        job : ValidationJob
+            job to run
+
+        Returns
+        -------
+        concurrent.futures.Future of the job's result
+        """
+        key = self.cache.key(job.paste, job.channel_name)
+        result = self.cache.get(key)
+        if result is not None:
+            # every paste gets its own reply and reporter
+            reply, report = result
+            reporter = Reporter()
+            reporter.add_report(report)
+            future = Future()
+            future.set_result((Records(reply), reporter))
+            return future
+
+        future = self.executor.submit(job.run)
+        future.add_done_callback(lambda f: self._cache_result(key, f))
+        return future
+
+    def submit_paste(self, paste, channel_name):
+        """
+        Validate a paste in the pool.
+        In MULTI_FILE_MODE every file in the paste is validated at the same time,
+        and the results are combined.
+        Splitting and hashing the paste reads every line, call this off the event loop.
+
+        Parameters
+        ----------
+        paste : str or list
+            paste text, or its lines
+
+        channel_name : str
+            name of the channel the paste was sent in
+
+        Returns
+        -------
+        concurrent.futures.Future of (Records reply, Reporter)
+        """
+        files = paste_parser.split_files(paste) if MULTI_FILE_MODE else None
+        if not files or len(files) < 2:
+            return self.submit(ValidationJob(paste, channel_name))
+
+        futures = [self.submit(ValidationJob(lines, channel_name)) for lines in files]
+        combined = Future()
+        # number of files still being validated
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def file_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] > 0:
+                    return
+            try:
+                combined.set_result(
+                    combine_results(files, [f.result() for f in futures])
+                )
+            except BaseException as e:
+                combined.set_exception(e)
+
+        for f in futures:
+            f.add_done_callback(file_done)
+        return combined
+
+    async def run_paste(self, paste, channel_name):
+        """
+        Validate a paste in the pool without blocking the event loop
+
+        Parameters
+        ----------
+        paste : str or list
+            paste text, or its lines
+
+        channel_name : str
+            name of the channel the paste was sent in
+
+        Returns
+        -------
+        Records reply, Reporter with the results
+        """
+        loop = asyncio.get_running_loop()
+        # split and hash the paste in a thread
+        future = await loop.run_in_executor(
+            None, self.submit_paste, paste, channel_name
+        )
+        return await asyncio.wrap_future(future)
+
+    def _cache_result(self, key, future):
+        """
+        Cache a copy of a finished job's reply and report results,
+        unless something failed or an online lookup failed
+
+        Parameters
+        ----------
+        key : str
+            cache key
+
+        future : concurrent.futures.Future
+            finished job
+        """
+        if future.cancelled() or future.exception() is not None:
+            return
+        reply, reporter = future.result()
+        if reporter.get_report()["fail"] == 0 and not reporter.lookup_failed:
+            self.cache.set(key, (Records(reply), dict(reporter.get_report())))
+
+    async def run(self, job):
+        """
+        Run a validation job in the pool without blocking the event loop
+
+        Parameters
+        ----------
+        job : ValidationJob
+            job to run
+
+        Returns
+        -------
+        Records reply, Reporter with the results
+        """
+        loop = asyncio.get_running_loop()
+        # hash the paste in a thread
+        future = await loop.run_in_executor(None, self.submit, job)
+        return await asyncio.wrap_future(future)